@@ -1 +0,0 @@
-print("Expense Tracker Started")
@@ -1,7 +1,11 @@
+import subprocess
+
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # frames only ever go to the MP4, no GUI needed
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, FFMpegWriter
 import matplotlib as mpl
+from matplotlib.collections import LineCollection
 from matplotlib import font_manager
 from mpl_toolkits.mplot3d import Axes3D
 
@@ -18,6 +22,11 @@ def set_english_font():
 
 set_english_font()
 
+# Let Agg drop sub-pixel vertices and rasterise long paths in chunks
+mpl.rcParams["path.simplify"] = True
+mpl.rcParams["path.simplify_threshold"] = 1.0
+mpl.rcParams["agg.path.chunksize"] = 10000
+
 # ---------- SETTINGS ----------
 FPS = 30
 SIZE_PX = 600
@@ -43,15 +52,16 @@ labels = [d for d, _ in rows]
 vals = np.array([v for _, v in rows], dtype=float)
 n = len(vals)
 
-# Enhanced color palette
-def pct_color(v):
-    if v >= 17.0:
-        return (0.95, 0.25, 0.30)
-    if v >= 9.0:
-        return (1.00, 0.60, 0.10)
-    if v >= 6.0:
-        return (1.00, 0.80, 0.35)
-    return (0.35, 0.85, 0.45)
+# Enhanced color palette, indexed by bucket: <6, 6..9, 9..17, >=17
+palette = np.array([
+    [0.35, 0.85, 0.45],
+    [1.00, 0.80, 0.35],
+    [1.00, 0.60, 0.10],
+    [0.95, 0.25, 0.30],
+])
+bins = np.array([6.0, 9.0, 17.0])
+color_idx = np.searchsorted(bins, vals, side='right')
+colors = [tuple(c) for c in palette[color_idx]]
 
 # ---------- ANIMATION PHASES ----------
 PHASE1_FRAMES = 60   # Flat circle view
@@ -63,23 +73,12 @@ total_frames = PHASE1_FRAMES + PHASE2_FRAMES + PHASE3_FRAMES
 fig = plt.figure(figsize=(SIZE_PX / DPI, SIZE_PX / DPI), dpi=DPI)
 fig.patch.set_facecolor("#0a0a0a")
 
-ax = fig.add_subplot(111, projection='3d')
-ax.set_facecolor("#0a0a0a")
-ax.grid(False)
-ax.set_xlim(-1.5, 1.5)
-ax.set_ylim(-1.5, 1.5)
-ax.set_zlim(0, n * 0.15)
-
-# Hide axes
-ax.set_xticks([])
-ax.set_yticks([])
-ax.set_zticks([])
-ax.xaxis.pane.fill = False
-ax.yaxis.pane.fill = False
-ax.zaxis.pane.fill = False
-ax.xaxis.pane.set_edgecolor('none')
-ax.yaxis.pane.set_edgecolor('none')
-ax.zaxis.pane.set_edgecolor('none')
+# The 3D axes only supplies the camera: its projection matrix for every
+# frame is baked into a table below, then a plain 2D axes takes its place
+ax3d = fig.add_subplot(111, projection='3d')
+ax3d.set_xlim(-1.5, 1.5)
+ax3d.set_ylim(-1.5, 1.5)
+ax3d.set_zlim(0, n * 0.15)
 
 # Title
 title_text = fig.text(0.5, 0.95, TITLE_TEXT, ha='center', va='top',
@@ -87,11 +86,11 @@ title_text = fig.text(0.5, 0.95, TITLE_TEXT, ha='center', va='top',
 
 # Date text
 date_text = fig.text(0.5, 0.05, "", ha='center', va='bottom',
-                     color='#aaaaaa', fontsize=11)
+                     color='#aaaaaa', fontsize=11, animated=True)
 
 # Value text
 value_text = fig.text(0.5, 0.90, "", ha='center', va='top',
-                      color='white', fontsize=13, fontweight='bold')
+                      color='white', fontsize=13, fontweight='bold', animated=True)
 
 # Scale settings
 PCT_MAX = 22.0
@@ -99,7 +98,17 @@ r_min, r_max = 0.3, 1.2
 radii = r_min + np.clip(vals / PCT_MAX, 0, 1) * (r_max - r_min)
 
 # Create circle data
-theta = np.linspace(0, 2*np.pi, 200)
+# 64 vertices per circle is already sub-pixel at this output size
+N_THETA = 64
+theta = np.linspace(0, 2*np.pi, N_THETA, dtype=np.float32)
+cos_t = np.cos(theta)
+sin_t = np.sin(theta)
+
+# Precomputed circle vertices, one row per day (float32 is plenty for
+# screen coordinates and halves what goes through the transforms)
+radii = radii.astype(np.float32)
+xs = radii[:, None] * cos_t
+ys = radii[:, None] * sin_t
 
 def lerp(a, b, t):
     return a + (b - a) * t
@@ -107,73 +116,87 @@ def lerp(a, b, t):
 def ease_in_out(t):
     return t * t * (3 - 2 * t)
 
-# Storage for 3D lines
-circles_3d = []
-for i in range(n):
-    line, = ax.plot([], [], [], lw=2.5, alpha=0.0)
-    circles_3d.append(line)
+# ---------- CAMERA PATH ----------
+# elev/azim are a fixed function of the frame, so bake them up front
+frame_idx = np.arange(total_frames)
+turn = ease_in_out(np.clip((frame_idx - PHASE1_FRAMES) / PHASE2_FRAMES, 0, 1))
+spin = np.clip((frame_idx - PHASE1_FRAMES - PHASE2_FRAMES) / PHASE3_FRAMES, 0, 1)
+in_turn = frame_idx < PHASE1_FRAMES + PHASE2_FRAMES
+elev = np.where(in_turn, lerp(90, 25, turn), 25.0)
+azim = np.where(in_turn, lerp(0, -60, turn), -60 + spin * 30)
+
+# mplot3d's own (perspective) projection matrix per frame, shape (frames, 4, 4),
+# and where it puts its three axis lines, shape (frames, 3, 2, 2)
+renderer = fig.canvas.get_renderer()
+proj = np.empty((total_frames, 4, 4), dtype=np.float32)
+axis_lines = np.empty((total_frames, 3, 2, 2), dtype=np.float32)
+for f in range(total_frames):
+    ax3d.view_init(elev=elev[f], azim=azim[f])
+    ax3d.M = ax3d.get_proj()
+    ax3d.invM = np.linalg.inv(ax3d.M)
+    proj[f] = ax3d.M
+    for k, axis in enumerate((ax3d.xaxis, ax3d.yaxis, ax3d.zaxis)):
+        axis.draw(renderer)
+        axis_lines[f, k] = np.column_stack(axis.line.get_data())
+
+# Same box and 2D limits the 3D axes projects into, so the framing is unchanged
+ax = fig.add_axes(ax3d.get_position())
+ax.set_facecolor("#0a0a0a")
+ax.set_xlim(ax3d.viewLim.intervalx)
+ax.set_ylim(ax3d.viewLim.intervaly)
+ax.axis('off')
+ax3d.remove()
+
+def project(frame, x, y, z_level):
+    """Screen-space (x, y) of a circle at height z_level for this frame"""
+    m = proj[frame]
+    pts = m[:, :2] @ np.stack([x, y]) + m[:, 2:3] * z_level + m[:, 3:]
+    return pts[:2] / pts[3]
+
+# Axis lines go under the circles, as mplot3d draws them
+spines = LineCollection([], colors=mpl.rcParams["axes.edgecolor"],
+                        linewidths=mpl.rcParams["axes.linewidth"], animated=True)
+ax.add_collection(spines, autolim=False)
+
+# All visible circles are drawn as one collection
+circles = LineCollection([], animated=True)
+ax.add_collection(circles, autolim=False)
 
 def init():
-    for line in circles_3d:
-        line.set_data([], [])
-        line.set_3d_properties([])
-    return circles_3d + [title_text, date_text, value_text]
+    spines.set_segments([])
+    circles.set_segments([])
+    return [spines, circles, date_text, value_text]
 
 def update(frame):
-    # Clear all circles
-    for line in circles_3d:
-        line.set_data([], [])
-        line.set_3d_properties([])
-        line.set_alpha(0.0)
+    spines.set_segments(axis_lines[frame])
+    segments, rgba, widths = [], [], []
     
     # PHASE 1: Show flat circle view (top view)
     if frame < PHASE1_FRAMES:
         idx = int((frame / PHASE1_FRAMES) * n)
         idx = min(idx, n - 1)
         
-        # Set top view
-        ax.view_init(elev=90, azim=0)
-        
-        # Draw current circle
-        r = radii[idx]
-        x = r * np.cos(theta)
-        y = r * np.sin(theta)
-        z = np.zeros_like(theta)
-        
-        circles_3d[0].set_data(x, y)
-        circles_3d[0].set_3d_properties(z)
-        circles_3d[0].set_color(pct_color(vals[idx]))
-        circles_3d[0].set_alpha(0.95)
-        circles_3d[0].set_linewidth(3.0)
+        # Draw current circle (top view)
+        segments.append(project(frame, xs[idx], ys[idx], 0.0).T)
+        rgba.append((*colors[idx], 0.95))
+        widths.append(3.0)
         
         date_text.set_text(labels[idx])
         value_text.set_text(f"{vals[idx]:.2f}%")
-        value_text.set_color(pct_color(vals[idx]))
+        value_text.set_color(colors[idx])
     
     # PHASE 2: Transition to 3D view
     elif frame < PHASE1_FRAMES + PHASE2_FRAMES:
         progress = (frame - PHASE1_FRAMES) / PHASE2_FRAMES
         progress = ease_in_out(progress)
         
-        # Rotate camera
-        elev = lerp(90, 25, progress)
-        azim = lerp(0, -60, progress)
-        ax.view_init(elev=elev, azim=azim)
-        
-        # Show first few circles stacking
+        # Show first few circles stacking while the camera turns
         num_show = int(progress * 8) + 1
         for i in range(min(num_show, n)):
-            r = radii[i]
-            x = r * np.cos(theta)
-            y = r * np.sin(theta)
             z_level = i * 0.15 * progress
-            z = np.full_like(theta, z_level)
-            
-            circles_3d[i].set_data(x, y)
-            circles_3d[i].set_3d_properties(z)
-            circles_3d[i].set_color(pct_color(vals[i]))
-            circles_3d[i].set_alpha(0.85)
-            circles_3d[i].set_linewidth(2.5)
+            segments.append(project(frame, xs[i], ys[i], z_level).T)
+            rgba.append((*colors[i], 0.85))
+            widths.append(2.5)
         
         date_text.set_text("Building Cylinder...")
         value_text.set_text("")
@@ -182,47 +205,63 @@ def update(frame):
     else:
         progress = (frame - PHASE1_FRAMES - PHASE2_FRAMES) / PHASE3_FRAMES
         
-        # Slow rotation
-        azim = -60 + (progress * 30)
-        ax.view_init(elev=25, azim=azim)
-        
-        # Build cylinder progressively
+        # Build cylinder progressively under a slow rotation
         num_show = int(progress * n)
         num_show = min(num_show, n)
         
         for i in range(num_show):
-            r = radii[i]
-            x = r * np.cos(theta)
-            y = r * np.sin(theta)
             z_level = i * 0.15
-            z = np.full_like(theta, z_level)
-            
-            circles_3d[i].set_data(x, y)
-            circles_3d[i].set_3d_properties(z)
-            circles_3d[i].set_color(pct_color(vals[i]))
+            segments.append(project(frame, xs[i], ys[i], z_level).T)
             
             # Fade older circles slightly
             age_factor = 1.0 - (i / max(1, num_show)) * 0.3
-            circles_3d[i].set_alpha(0.75 * age_factor)
-            circles_3d[i].set_linewidth(2.2)
+            rgba.append((*colors[i], 0.75 * age_factor))
+            widths.append(2.2)
         
         # Show current date
         if num_show > 0:
             current_idx = num_show - 1
             date_text.set_text(labels[current_idx])
             value_text.set_text(f"{vals[current_idx]:.2f}%")
-            value_text.set_color(pct_color(vals[current_idx]))
+            value_text.set_color(colors[current_idx])
         
         # Highlight current circle
         if num_show > 0:
-            circles_3d[num_show - 1].set_alpha(0.95)
-            circles_3d[num_show - 1].set_linewidth(3.5)
+            rgba[-1] = (*colors[num_show - 1], 0.95)
+            widths[-1] = 3.5
+    
+    circles.set_segments(segments)
+    if segments:
+        circles.set_color(rgba)
+        circles.set_linewidth(widths)
     
-    return circles_3d + [title_text, date_text, value_text]
+    return [spines, circles, date_text, value_text]
 
 # ---------- SAVE ----------
-anim = FuncAnimation(fig, update, frames=total_frames, init_func=init, blit=False, interval=1000/FPS)
-anim.save(OUT_MP4, writer=FFMpegWriter(fps=FPS, bitrate=4000))
+# Static artists are rendered once; each frame restores that background
+# and draws only the animated artists on top.
+fig.canvas.draw()
+background = fig.canvas.copy_from_bbox(fig.bbox)
+width, height = fig.canvas.get_width_height()
+
+# Stream raw RGBA frames straight into an ffmpeg pipe
+proc = subprocess.Popen([
+    "ffmpeg", "-y",
+    "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(FPS),
+    "-i", "-",
+    "-c:v", "libx264", "-preset", "veryfast", "-crf", "20", "-pix_fmt", "yuv420p",
+    OUT_MP4,
+], stdin=subprocess.PIPE)
+
+init()
+for frame in range(total_frames):
+    artists = update(frame)
+    fig.canvas.restore_region(background)
+    for artist in artists:
+        fig.draw_artist(artist)
+    proc.stdin.write(fig.canvas.buffer_rgba())
+proc.stdin.close()
+proc.wait()
 print(f"✓ 3D Cylinder animation saved: {OUT_MP4}")
 print(f"Duration: {total_frames/FPS:.1f} seconds")
 plt.close()
\ No newline at end of file
@@ -1,7 +1,12 @@
+import subprocess
+
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # frames only ever go to the MP4, no GUI needed
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, FFMpegWriter
 import matplotlib as mpl
+from matplotlib.collections import LineCollection
+import matplotlib.patheffects as pe
 from matplotlib import font_manager
 from mpl_toolkits.mplot3d import Axes3D
 
@@ -18,11 +23,17 @@ def set_english_font():
 
 set_english_font()
 
+# Let Agg drop sub-pixel vertices and rasterise long paths in chunks
+mpl.rcParams["path.simplify"] = True
+mpl.rcParams["path.simplify_threshold"] = 1.0
+mpl.rcParams["agg.path.chunksize"] = 10000
+
 # Smooth lines
 mpl.rcParams["path.sketch"] = (0.6, 80, 1.2)
 
 # ---------- SETTINGS ----------
 FPS = 30
+RENDER_STEP = 2  # matplotlib renders every 2nd frame, ffmpeg fills the rest
 SIZE_PX = 600
 DPI = 150
 OUT_MP4 = "spiral_kerman_cylinder.mp4"
@@ -47,24 +58,21 @@ labels = [d for d, _ in rows]
 vals = np.array([v for _, v in rows], dtype=float)
 n = len(vals)
 
-# Enhanced color palette
-def pct_color(v):
-    if v >= 17.0:
-        return (0.95, 0.25, 0.30)
-    if v >= 9.0:
-        return (1.00, 0.60, 0.10)
-    if v >= 6.0:
-        return (1.00, 0.80, 0.35)
-    return (0.35, 0.85, 0.45)
-
-def get_status(v):
-    if v >= 17.0:
-        return "CRITICAL", "#ff3344"
-    if v >= 9.0:
-        return "WARNING", "#ff9922"
-    if v >= 6.0:
-        return "MODERATE", "#ffcc66"
-    return "EXCELLENT", "#35d555"
+# Enhanced color palette, indexed by bucket: <6, 6..9, 9..17, >=17
+palette = np.array([
+    [0.35, 0.85, 0.45],
+    [1.00, 0.80, 0.35],
+    [1.00, 0.60, 0.10],
+    [0.95, 0.25, 0.30],
+])
+bins = np.array([6.0, 9.0, 17.0])
+color_idx = np.searchsorted(bins, vals, side='right')
+colors = [tuple(c) for c in palette[color_idx]]
+
+# Status name/color per bucket, in the same order as the palette
+status_names = ["EXCELLENT", "MODERATE", "WARNING", "CRITICAL"]
+status_colors = ["#35d555", "#ffcc66", "#ff9922", "#ff3344"]
+statuses = [(status_names[c], status_colors[c]) for c in color_idx]
 
 def lerp(a, b, t):
     return a + (b - a) * t
@@ -83,32 +91,68 @@ r_min, r_max = 0.3, 1.2
 radii = r_min + np.clip(vals / PCT_MAX, 0, 1) * (r_max - r_min)
 
 # Create circle points
-theta_full = np.linspace(0, 2*np.pi, 200)
+# 64 vertices per circle is already sub-pixel at this output size
+N_THETA = 64
+theta_full = np.linspace(0, 2*np.pi, N_THETA, dtype=np.float32)
+cos_t = np.cos(theta_full)
+sin_t = np.sin(theta_full)
+
+# Precomputed circle vertices, one row per day (float32 is plenty for
+# screen coordinates and halves what goes through the transforms)
+radii = radii.astype(np.float32)
+xs = radii[:, None] * cos_t
+ys = radii[:, None] * sin_t
 
 # ---------- FIGURE SETUP ----------
 fig = plt.figure(figsize=(SIZE_PX / DPI, SIZE_PX / DPI), dpi=DPI)
 fig.patch.set_facecolor("#0a0a0a")
 
-ax = fig.add_subplot(111, projection='3d')
+# The 3D axes only supplies the camera: its projection matrix for every
+# frame is baked into a table below, then a plain 2D axes takes its place
+ax3d = fig.add_subplot(111, projection='3d')
+ax3d.set_xlim(-1.5, 1.5)
+ax3d.set_ylim(-1.5, 1.5)
+ax3d.set_zlim(0, n * 0.15)
+
+# ---------- CAMERA PATH ----------
+# Fixed elevation with a slow 30° azimuth sweep over the whole movie
+elev = np.full(total_frames, 25.0)
+azim = -60 + (np.arange(total_frames) / total_frames) * 30
+
+# mplot3d's own (perspective) projection matrix per frame, shape (frames, 4, 4),
+# and where it puts its three axis lines, shape (frames, 3, 2, 2)
+renderer = fig.canvas.get_renderer()
+proj = np.empty((total_frames, 4, 4), dtype=np.float32)
+axis_lines = np.empty((total_frames, 3, 2, 2), dtype=np.float32)
+for f in range(total_frames):
+    ax3d.view_init(elev=elev[f], azim=azim[f])
+    ax3d.M = ax3d.get_proj()
+    ax3d.invM = np.linalg.inv(ax3d.M)
+    proj[f] = ax3d.M
+    for k, axis in enumerate((ax3d.xaxis, ax3d.yaxis, ax3d.zaxis)):
+        axis.draw(renderer)
+        axis_lines[f, k] = np.column_stack(axis.line.get_data())
+
+# Same box and 2D limits the 3D axes projects into, so the framing is unchanged
+ax = fig.add_axes(ax3d.get_position())
 ax.set_facecolor("#0a0a0a")
-ax.grid(False)
-ax.set_xlim(-1.5, 1.5)
-ax.set_ylim(-1.5, 1.5)
-ax.set_zlim(0, n * 0.15)
-
-# Hide axes
-ax.set_xticks([])
-ax.set_yticks([])
-ax.set_zticks([])
-ax.xaxis.pane.fill = False
-ax.yaxis.pane.fill = False
-ax.zaxis.pane.fill = False
-ax.xaxis.pane.set_edgecolor('none')
-ax.yaxis.pane.set_edgecolor('none')
-ax.zaxis.pane.set_edgecolor('none')
-
-# Set 3D view angle
-ax.view_init(elev=25, azim=-60)
+ax.set_xlim(ax3d.viewLim.intervalx)
+ax.set_ylim(ax3d.viewLim.intervaly)
+ax.axis('off')
+ax3d.remove()
+
+# Per-circle x/y rows, shape (n, 2, N_THETA), and z levels
+xy = np.stack([xs, ys], axis=1)
+z_levels = (np.arange(n) * 0.15).astype(np.float32)
+
+def project_trail(frame, start, i, points):
+    """Screen-space segments of circles start..i, the newest cut at points"""
+    m = proj[frame]
+    pts = m[:, :2] @ xy[start:i + 1] + m[:, 2:3] * z_levels[start:i + 1, None, None] + m[:, 3:]
+    pts = pts[:, :2] / pts[:, 3:]
+    segments = list(pts[:-1].transpose(0, 2, 1))
+    segments.append(pts[-1, :, :points].T)
+    return segments
 
 # Title at top
 title_text = fig.text(0.5, 0.94, TITLE_TEXT, ha='center', va='top',
@@ -119,38 +163,57 @@ subtitle_text = fig.text(0.5, 0.90, SUBTITLE_TEXT, ha='center', va='top',
 
 # Center percentage
 value_text = fig.text(0.5, 0.53, "", ha='center', va='center',
-                      color='white', fontsize=18, fontweight='bold', alpha=0.95)
+                      color='white', fontsize=18, fontweight='bold', alpha=0.95,
+                      animated=True)
 
 # Status
 status_text = fig.text(0.5, 0.46, "", ha='center', va='center',
-                       color='white', fontsize=8, fontweight='bold', alpha=0.9)
+                       color='white', fontsize=8, fontweight='bold', alpha=0.9,
+                       animated=True)
 
 # Date at bottom
 date_text = fig.text(0.5, 0.06, "", ha='center', va='bottom',
-                     color='#aaaaaa', fontsize=10, alpha=0.9)
-
-# Storage for circles and glows
-circles_3d = []
-glows_3d = []
-for i in range(n):
-    # Glow
-    glow, = ax.plot([], [], [], lw=5.0, alpha=0.0)
-    glows_3d.append(glow)
-    # Main line
-    line, = ax.plot([], [], [], lw=2.5, alpha=0.0)
-    circles_3d.append(line)
+                     color='#aaaaaa', fontsize=10, alpha=0.9, animated=True)
+
+class Glow(pe.AbstractPathEffect):
+    """Wider, fainter copy of each stroke, drawn underneath it"""
+
+    def draw_path(self, renderer, gc, tpath, affine, rgbFace=None):
+        gc0 = renderer.new_gc()
+        gc0.copy_properties(gc)
+        r, g, b, a = gc.get_rgb()
+        gc0.set_foreground((r, g, b, a * 0.2), isRGBA=True)
+        gc0.set_linewidth(gc.get_linewidth() * 2.2)
+        renderer.draw_path(gc0, tpath, affine, rgbFace)
+        gc0.restore()
+
+# Axis lines go under the circles, as mplot3d draws them
+spines = LineCollection([], colors=mpl.rcParams["axes.edgecolor"],
+                        linewidths=mpl.rcParams["axes.linewidth"], animated=True)
+ax.add_collection(spines, autolim=False)
+
+# Trail circles in one collection; the glow is a path effect on the same paths
+circles = LineCollection([], animated=True, path_effects=[Glow(), pe.Normal()])
+ax.add_collection(circles, autolim=False)
+
+animated_artists = [spines, circles, value_text, date_text, status_text]
 
 TRAIL = 8  # Number of visible previous circles
 
+# fade_table[k, d]: fade of the k-th trail circle when the newest is at d
+fade_table = np.zeros((TRAIL, TRAIL))
+for d in range(TRAIL):
+    for k in range(d + 1):
+        fade_table[k, d] = lerp(0.20, 0.70, k / max(1, d))
+
+# Trail window styled on the previous frame
+last_drawn = {"i": -1}
+
 def init():
-    for line, glow in zip(circles_3d, glows_3d):
-        line.set_data([], [])
-        line.set_3d_properties([])
-        line.set_alpha(0.0)
-        glow.set_data([], [])
-        glow.set_3d_properties([])
-        glow.set_alpha(0.0)
-    return circles_3d + glows_3d + [title_text, subtitle_text, value_text, date_text, status_text]
+    spines.set_segments([])
+    circles.set_segments([])
+    last_drawn["i"] = -1
+    return animated_artists
 
 def update(frame):
     item_frame = frame % (FRAMES_PER_CIRCLE + HOLD_FRAMES)
@@ -163,73 +226,31 @@ def update(frame):
     else:
         draw_progress = 1.0
     
-    # Slow rotation
-    rotation = (frame / total_frames) * 30
-    ax.view_init(elev=25, azim=-60 + rotation)
-    
-    # Clear all
-    for line, glow in zip(circles_3d, glows_3d):
-        line.set_data([], [])
-        line.set_3d_properties([])
-        line.set_alpha(0.0)
-        glow.set_data([], [])
-        glow.set_3d_properties([])
-        glow.set_alpha(0.0)
-    
     # Calculate visible range
     start = max(0, i - TRAIL + 1)
-    recent = list(range(start, i + 1))
-    denom = max(1, len(recent) - 1)
+    count = i + 1 - start
     
-    for k, j in enumerate(recent):
-        z_level = j * 0.15
-        
-        if j < i:
-            # Previous circles - fully drawn
-            theta = theta_full
-            r = radii[j]
-            x = r * np.cos(theta)
-            y = r * np.sin(theta)
-            z = np.full_like(theta, z_level)
-        else:
-            # Current circle - drawing clockwise
-            num_points = len(theta_full)
-            points_to_draw = int(num_points * draw_progress)
-            if points_to_draw < 2:
-                continue
-            theta = theta_full[:points_to_draw]
-            r = radii[j]
-            x = r * np.cos(theta)
-            y = r * np.sin(theta)
-            z = np.full(len(theta), z_level)
-        
-        color = pct_color(vals[j])
-        
-        # Fade based on position
-        if j < i:
-            fade = lerp(0.20, 0.70, k / denom)
-            line_width = 2.0
-            glow_width = 4.5
-        else:
-            fade = 0.95
-            line_width = 3.0
-            glow_width = 6.5
+    # Styles only depend on (start, i): touch them when a new circle begins
+    if i != last_drawn["i"]:
+        # Fade previous circles by position, highlight the current one
+        older = np.arange(count) < count - 1
+        fade = np.where(older, fade_table[:count, count - 1], 0.95)
+        rgb = palette[color_idx[start:i + 1]]
         
-        # Glow
-        glow = glows_3d[j]
-        glow.set_data(x, y)
-        glow.set_3d_properties(z)
-        glow.set_color(color)
-        glow.set_alpha(fade * 0.2)
-        glow.set_linewidth(glow_width)
-        
-        # Main line
-        line = circles_3d[j]
-        line.set_data(x, y)
-        line.set_3d_properties(z)
-        line.set_color(color)
-        line.set_alpha(fade)
-        line.set_linewidth(line_width)
+        circles.set_color(np.column_stack([rgb, fade]))
+        circles.set_linewidth(np.where(older, 2.0, 3.0))
+        last_drawn["i"] = i
+    
+    # Previous circles are fully drawn, the current one draws clockwise
+    points_to_draw = int(N_THETA * draw_progress)
+    if points_to_draw < 2:
+        points_to_draw = 0
+    
+    # Geometry moves with the camera, so the trail is re-projected each frame
+    spines.set_segments(axis_lines[frame])
+    segments = project_trail(frame, start, i, points_to_draw)
+    
+    circles.set_segments(segments)
     
     # Text updates
     if item_frame < 10:
@@ -239,19 +260,42 @@ def update(frame):
         date_text.set_alpha(alpha * 0.9)
     
     value_text.set_text(f"{vals[i]:.2f}%")
-    value_text.set_color(pct_color(vals[i]))
+    value_text.set_color(colors[i])
     date_text.set_text(labels[i])
     
-    stat, stat_color = get_status(vals[i])
+    stat, stat_color = statuses[i]
     status_text.set_text(stat)
     status_text.set_color(stat_color)
     
-    return (circles_3d + glows_3d + 
-            [title_text, subtitle_text, value_text, date_text, status_text])
+    return animated_artists
 
 # ---------- SAVE ----------
-anim = FuncAnimation(fig, update, frames=total_frames, init_func=init, blit=False, interval=1000/FPS)
-anim.save(OUT_MP4, writer=FFMpegWriter(fps=FPS, bitrate=4500))
+# Static artists are rendered once; each frame restores that background
+# and draws only the animated artists on top.
+fig.canvas.draw()
+background = fig.canvas.copy_from_bbox(fig.bbox)
+width, height = fig.canvas.get_width_height()
+
+# Stream raw RGBA frames straight into an ffmpeg pipe
+proc = subprocess.Popen([
+    "ffmpeg", "-y",
+    "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}",
+    "-r", str(FPS / RENDER_STEP),
+    "-i", "-",
+    "-vf", f"minterpolate=fps={FPS}:mi_mode=blend",
+    "-c:v", "libx264", "-preset", "veryfast", "-crf", "20", "-pix_fmt", "yuv420p",
+    OUT_MP4,
+], stdin=subprocess.PIPE)
+
+init()
+for frame in range(0, total_frames, RENDER_STEP):
+    artists = update(frame)
+    fig.canvas.restore_region(background)
+    for artist in artists:
+        fig.draw_artist(artist)
+    proc.stdin.write(fig.canvas.buffer_rgba())
+proc.stdin.close()
+proc.wait()
 duration = total_frames / FPS
 print(f"✓ 3D Cylinder animation saved: {OUT_MP4}")
 print(f"Duration: {duration:.1f} seconds")
@@ -1,8 +1,12 @@
+import subprocess
+
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # frames only ever go to the MP4, no GUI needed
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, FFMpegWriter
 from matplotlib import font_manager
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 # ---------- FONT SETUP ----------
 def set_english_font():
@@ -13,6 +17,11 @@ def set_english_font():
 
 set_english_font()
 
+# Let Agg drop sub-pixel vertices and rasterise long paths in chunks
+plt.rcParams["path.simplify"] = True
+plt.rcParams["path.simplify_threshold"] = 1.0
+plt.rcParams["agg.path.chunksize"] = 10000
+
 # ---------- DATA ----------
 rows = [
     ("1404/09/01", 11.40), ("1404/09/02", 4.44), ("1404/09/03", 16.81),
@@ -32,26 +41,23 @@ vals = np.array([v for _, v in rows], dtype=float)
 n = len(vals)
 
 # ---------- COLOR PALETTE ----------
-def pct_color(v):
-    if v >= 17.0:
-        return (0.95, 0.25, 0.30)   # Red
-    if v >= 9.0:
-        return (1.00, 0.60, 0.10)   # Orange
-    if v >= 6.0:
-        return (1.00, 0.80, 0.35)   # Light Orange
-    return (0.35, 0.85, 0.45)       # Green
+palette = np.array([
+    [0.35, 0.85, 0.45],   # Green
+    [1.00, 0.80, 0.35],   # Light Orange
+    [1.00, 0.60, 0.10],   # Orange
+    [0.95, 0.25, 0.30],   # Red
+])
+bins = np.array([6.0, 9.0, 17.0])
+color_idx = np.searchsorted(bins, vals, side='right')
+colors = [tuple(c) for c in palette[color_idx]]
 
 def lerp(a, b, t):
     return a + (b - a) * t
 
-def get_status(v):
-    if v >= 17.0:
-        return "CRITICAL", "#ff3344"
-    if v >= 9.0:
-        return "WARNING", "#ff9922"
-    if v >= 6.0:
-        return "MODERATE", "#ffcc66"
-    return "EXCELLENT", "#35d555"
+# Status name/color per bucket, in the same order as the palette
+status_names = ["EXCELLENT", "MODERATE", "WARNING", "CRITICAL"]
+status_colors = ["#35d555", "#ffcc66", "#ff9922", "#ff3344"]
+statuses = [(status_names[c], status_colors[c]) for c in color_idx]
 
 # ---------- SETTINGS ----------
 FPS = 30
@@ -64,7 +70,17 @@ total_frames = n * (FRAMES_PER_ITEM + HOLD_FRAMES)
 radius = 1.0
 height = 0.3 * n  # فاصله محورها برای هر روز
 
-theta_full = np.linspace(0, 2*np.pi, 300)
+# 64 vertices per circle is already sub-pixel at this output size
+N_THETA = 64
+theta_full = np.linspace(0, 2*np.pi, N_THETA, dtype=np.float32)
+cos_t = np.cos(theta_full)
+sin_t = np.sin(theta_full)
+
+# Precomputed circle vertices, one row per day (float32 is plenty for
+# screen coordinates and halves what goes through the transforms)
+radii = (radius * (0.5 + 0.5 * vals / vals.max())).astype(np.float32)
+xs = radii[:, None] * cos_t
+ys = radii[:, None] * sin_t
 
 # ---------- FIGURE ----------
 fig = plt.figure(figsize=(8, 6))
@@ -80,20 +96,32 @@ ax.grid(False)
 ax.set_box_aspect([1,1,0.6])
 ax.view_init(elev=30, azim=-60)
 
-# Trail storage
-trail_lines = []
+# Trail circles as one collection; segments come from a (n, N_THETA, 3) table
+circle_xyz = np.stack([xs, ys, np.broadcast_to(np.arange(n, dtype=np.float32)[:, None]*0.3, xs.shape)], axis=-1)
+trail = Line3DCollection([], animated=True)
+ax.add_collection(trail, autolim=False)
+
+# Labels for the current item, mutated in place every frame
+date_label_artist = ax.text(0, 0, 0, "", color="white", fontsize=8, ha="center", va="center", animated=True)
+pct_artist = ax.text(0, 0, 0, "", fontsize=12, ha="center", va="center", animated=True)
+status_artist = ax.text(0, 0, 0, "", fontsize=9, ha="center", va="center", animated=True)
+label_artists = [date_label_artist, pct_artist, status_artist]
+
+angle = np.pi/2
+x_label = (radius*1.1) * np.cos(angle)
+y_label = (radius*1.1) * np.sin(angle)
 
-for _ in range(TRAIL):
-    ln, = ax.plot([], [], [], lw=2, alpha=0)
-    trail_lines.append(ln)
+# Visible trail segments and the item/point count they were built for
+trail_segments = []
+last_drawn = {"i": -1, "points": -1}
 
 # ---------- ANIMATION FUNCTIONS ----------
 def init():
-    for ln in trail_lines:
-        ln.set_data([], [])
-        ln.set_3d_properties([])
-        ln.set_alpha(0.0)
-    return trail_lines
+    trail_segments.clear()
+    trail.set_segments([])
+    last_drawn["i"] = -1
+    last_drawn["points"] = -1
+    return [trail] + label_artists
 
 def update(frame):
     item_frame = frame % (FRAMES_PER_ITEM + HOLD_FRAMES)
@@ -106,59 +134,69 @@ def update(frame):
     else:
         draw_progress = 1.0
     
-    points_to_draw = int(len(theta_full) * draw_progress)
+    points_to_draw = int(N_THETA * draw_progress)
     
-    # Clear previous trails
-    for ln in trail_lines:
-        ln.set_data([], [])
-        ln.set_3d_properties([])
-        ln.set_alpha(0.0)
-    
-    # Determine which previous items to show
-    start = max(0, i - TRAIL + 1)
-    recent = list(range(start, i+1))
-    denom = max(1, len(recent)-1)
-    
-    for k, j in enumerate(recent):
-        if j < i:
-            theta = theta_full
-        else:
-            if points_to_draw < 2:
-                continue
-            theta = theta_full[:points_to_draw]
+    # A new item: rebuild the trail window and its styles.
+    # Fades only depend on (start, i), so nothing else changes until then.
+    if i != last_drawn["i"]:
+        start = max(0, i - TRAIL + 1)
+        recent = list(range(start, i+1))
+        denom = max(1, len(recent)-1)
         
-        z = np.full_like(theta, j*0.3)
-        r = radius * (0.5 + 0.5 * vals[j]/max(vals))
-        x = r * np.cos(theta)
-        y = r * np.sin(theta)
+        trail_segments[:] = [circle_xyz[j] for j in recent]
+        trail.set_color([(*colors[j], lerp(0.15, 0.8, k/denom) if j<i else 0.95)
+                         for k, j in enumerate(recent)])
+        trail.set_linewidth([2 + 1*(j==i) for j in recent])
         
-        color = pct_color(vals[j])
-        fade = lerp(0.15, 0.8, k/denom) if j<i else 0.95
-        
-        ln = trail_lines[k]
-        ln.set_data(x, y)
-        ln.set_3d_properties(z)
-        ln.set_color(color)
-        ln.set_alpha(fade)
-        ln.set_linewidth(2 + 1*(j==i))
+        last_drawn["i"] = i
+        last_drawn["points"] = -1
+    
+    # Only the current circle grows between items
+    if points_to_draw != last_drawn["points"]:
+        trail_segments[-1] = circle_xyz[i, :points_to_draw if points_to_draw >= 2 else 0]
+        trail.set_segments(trail_segments)
+        # The camera is fixed, so project only when the geometry changes
+        trail.do_3d_projection()
+        last_drawn["points"] = points_to_draw
     
-    # Add date labels (show only current)
-    ax.texts.clear()
-    for idx in [i]:
-        angle = np.pi/2
-        x_label = (radius*1.1) * np.cos(angle)
-        y_label = (radius*1.1) * np.sin(angle)
-        ax.text(x_label, y_label, idx*0.3, labels[idx], color="white", fontsize=8, ha="center", va="center")
-        # Center percentage
-        ax.text(0,0, idx*0.3, f"{vals[idx]:.2f}%", color=pct_color(vals[idx]), fontsize=12, ha="center", va="center")
-        stat, stat_color = get_status(vals[idx])
-        ax.text(0,0, idx*0.3-0.05, stat, color=stat_color, fontsize=9, ha="center", va="center")
+    # Date label (show only current)
+    date_label_artist.set_position_3d((x_label, y_label, i*0.3))
+    date_label_artist.set_text(labels[i])
+    # Center percentage
+    pct_artist.set_position_3d((0, 0, i*0.3))
+    pct_artist.set_text(f"{vals[i]:.2f}%")
+    pct_artist.set_color(colors[i])
+    stat, stat_color = statuses[i]
+    status_artist.set_position_3d((0, 0, i*0.3-0.05))
+    status_artist.set_text(stat)
+    status_artist.set_color(stat_color)
     
-    return trail_lines + ax.texts
+    return [trail] + label_artists
 
 # ---------- SAVE ANIMATION ----------
-anim = FuncAnimation(fig, update, frames=total_frames, init_func=init, blit=True)
-writer = FFMpegWriter(fps=FPS, bitrate=4000)
-anim.save(OUT_MP4, writer=writer)
+# Static artists are rendered once; each frame restores that background
+# and draws only the animated artists on top.
+fig.canvas.draw()
+background = fig.canvas.copy_from_bbox(fig.bbox)
+frame_w, frame_h = fig.canvas.get_width_height()
+
+# Stream raw RGBA frames straight into an ffmpeg pipe
+proc = subprocess.Popen([
+    "ffmpeg", "-y",
+    "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{frame_w}x{frame_h}", "-r", str(FPS),
+    "-i", "-",
+    "-c:v", "libx264", "-preset", "veryfast", "-crf", "20", "-pix_fmt", "yuv420p",
+    OUT_MP4,
+], stdin=subprocess.PIPE)
+
+init()
+for frame in range(total_frames):
+    artists = update(frame)
+    fig.canvas.restore_region(background)
+    for artist in artists:
+        fig.draw_artist(artist)
+    proc.stdin.write(fig.canvas.buffer_rgba())
+proc.stdin.close()
+proc.wait()
 print(f"✓ Cylinder animation saved: {OUT_MP4}")
 plt.close()
@@ -1,10 +1,14 @@
+import subprocess
+
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # frames only ever go to the MP4, no GUI needed
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, FFMpegWriter
 
 # ---------- ENGLISH FONT ONLY ----------
 import matplotlib as mpl
 from matplotlib import font_manager
+from matplotlib.collections import LineCollection
 
 def set_english_font():
     preferred = ["Montserrat", "Poppins", "Inter", "Roboto", "Segoe UI", "Arial", "DejaVu Sans"]
@@ -18,8 +22,10 @@ def set_english_font():
 
 set_english_font()
 
-# ✏️ hand-drawn / pencil effect for paths
-mpl.rcParams["path.sketch"] = (1.2, 120, 2.5)
+# Let Agg drop sub-pixel vertices and rasterise long paths in chunks
+mpl.rcParams["path.simplify"] = True
+mpl.rcParams["path.simplify_threshold"] = 1.0
+mpl.rcParams["agg.path.chunksize"] = 10000
 
 # ---------- SETTINGS ----------
 FPS = 30
@@ -73,21 +79,40 @@ PCT_MAX = 22.0
 r_small, r_big = 0.15, 1.05
 r = r_small + np.clip(vals / PCT_MAX, 0, 1) * (r_big - r_small)
 
-theta_smooth = np.linspace(0, 2*np.pi, 720)
+# 64 vertices per circle is already sub-pixel at this output size;
+# the sketch jitter below adds the pencil detail along the path anyway
+N_THETA = 64
+theta_smooth = np.linspace(0, 2*np.pi, N_THETA, dtype=np.float32)
+
+# ✏️ hand-drawn / pencil effect: a fixed radial jitter per day, generated
+# once instead of running matplotlib's sketch filter on every draw
+# (low harmonics with random amplitude/phase, so every circle stays closed)
+rng = np.random.default_rng(1404)
+harmonics = np.arange(2, 8)
+amp = rng.normal(scale=0.006, size=(n, len(harmonics), 1))
+shift = rng.uniform(0, 2*np.pi, size=(n, len(harmonics), 1))
+sketch_noise = (amp * np.sin(harmonics[:, None] * theta_smooth + shift)).sum(axis=1)
+# float32 is plenty for the trail vertices and halves what goes through the transforms
+r_sketch = (r[:, None] + sketch_noise).astype(np.float32)
+
+# pencil wiggle basis: sin(7θ + φ) = sin7θ·cosφ + cos7θ·sinφ
+wiggle_sin = np.sin(theta_smooth * 7)
+wiggle_cos = np.cos(theta_smooth * 7)
 
 # ✅ NEW color rules:
 # >=17 red
 # 9..17 orange
 # 6..9 light orange
 # <6 green
-def pct_color(v):
-    if v >= 17.0:
-        return (0.90, 0.20, 0.20)   # red
-    if v >= 9.0:
-        return (1.00, 0.55, 0.00)   # orange
-    if v >= 6.0:
-        return (1.00, 0.75, 0.40)   # light orange
-    return (0.30, 0.75, 0.35)       # green
+palette = np.array([
+    [0.30, 0.75, 0.35],   # green
+    [1.00, 0.75, 0.40],   # light orange
+    [1.00, 0.55, 0.00],   # orange
+    [0.90, 0.20, 0.20],   # red
+])
+bins = np.array([6.0, 9.0, 17.0])
+color_idx = np.searchsorted(bins, vals, side='right')
+colors = [tuple(c) for c in palette[color_idx]]
 
 def lerp(a, b, t):
     return a + (b - a) * t
@@ -128,7 +153,8 @@ main_text = ax.text(
     ha="center", va="center",
     color="white",
     fontsize=11,
-    fontweight="bold"
+    fontweight="bold",
+    animated=True
 )
 
 date_text = ax.text(
@@ -136,25 +162,22 @@ date_text = ax.text(
     transform=ax.transAxes,
     ha="center", va="center",
     color="white",
-    fontsize=8
+    fontsize=8,
+    animated=True
 )
 
 # ---------- HAND-DRAWN CIRCLES ----------
 TRAIL = 25
-trail_lines = []
-for _ in range(TRAIL):
-    ln, = ax.plot([], [], lw=0.9, alpha=0.0)
-    ln.set_sketch_params(scale=1.2, length=120, randomness=2.5)
-    trail_lines.append(ln)
+# every trail circle lives in one collection of (theta, r) segments
+trail = LineCollection([], animated=True)
+ax.add_collection(trail, autolim=False)
 
 FRAMES_PER_ITEM = 18
 total_frames = n * FRAMES_PER_ITEM
 
 def init():
-    for ln in trail_lines:
-        ln.set_data([], [])
-        ln.set_alpha(0.0)
-    return trail_lines + [title_text, main_text, date_text]
+    trail.set_segments([])
+    return [trail, main_text, date_text]
 
 def update(frame):
     i = min(n - 1, frame // FRAMES_PER_ITEM)
@@ -163,27 +186,43 @@ def update(frame):
     recent = list(range(start, i + 1))
     denom = max(1, len(recent) - 1)
 
-    for ln in trail_lines:
-        ln.set_data([], [])
-        ln.set_alpha(0.0)
-
-    for k, j in enumerate(recent):
-        # subtle "pencil" wiggle
-        wiggle = 0.003 * np.sin(theta_smooth * 7 + frame * 0.15)
-        rr = np.full_like(theta_smooth, r[j]) + wiggle
+    # subtle "pencil" wiggle (same phase for every trail line)
+    phase = frame * 0.15
+    wiggle = 0.003 * (wiggle_sin * np.cos(phase) + wiggle_cos * np.sin(phase))
 
-        ln = trail_lines[k]
-        ln.set_data(theta_smooth, rr)
-        ln.set_color(pct_color(vals[j]))
-        ln.set_alpha(lerp(0.15, 0.85, k / denom))
-        ln.set_linewidth(0.7 if j < i else 1.2)
+    rr = r_sketch[start:i + 1] + wiggle
+    trail.set_segments(np.stack([np.broadcast_to(theta_smooth, rr.shape), rr], axis=-1))
+    trail.set_color([(*colors[j], lerp(0.15, 0.85, k / denom)) for k, j in enumerate(recent)])
+    trail.set_linewidth([0.7 if j < i else 1.2 for j in recent])
 
     main_text.set_text(f"{vals[i]:.2f}%")
     date_text.set_text(labels[i])
 
-    return trail_lines + [title_text, main_text, date_text]
+    return [trail, main_text, date_text]
 
 # ---------- SAVE ----------
-anim = FuncAnimation(fig, update, frames=total_frames, init_func=init, blit=True)
-anim.save(OUT_MP4, writer=FFMpegWriter(fps=FPS, bitrate=2500))
+# title and guide rings are static: render them once, then each frame
+# restores that background and draws only the animated artists on top.
+fig.canvas.draw()
+background = fig.canvas.copy_from_bbox(fig.bbox)
+width, height = fig.canvas.get_width_height()
+
+# Stream raw RGBA frames straight into an ffmpeg pipe
+proc = subprocess.Popen([
+    "ffmpeg", "-y",
+    "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(FPS),
+    "-i", "-",
+    "-c:v", "libx264", "-preset", "veryfast", "-crf", "20", "-pix_fmt", "yuv420p",
+    OUT_MP4,
+], stdin=subprocess.PIPE)
+
+init()
+for frame in range(total_frames):
+    artists = update(frame)
+    fig.canvas.restore_region(background)
+    for artist in artists:
+        fig.draw_artist(artist)
+    proc.stdin.write(fig.canvas.buffer_rgba())
+proc.stdin.close()
+proc.wait()
 print("Saved:", OUT_MP4)
\ No newline at end of file
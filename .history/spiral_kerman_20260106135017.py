@@ -1,6 +1,7 @@
+import subprocess
+
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, FFMpegWriter
 import matplotlib as mpl
 from matplotlib import font_manager
 
@@ -17,9 +18,6 @@ def set_english_font():
 
 set_english_font()
 
-# Smooth, elegant lines
-mpl.rcParams["path.sketch"] = (0.6, 80, 1.2)
-
 # ---------- SETTINGS ----------
 FPS = 30
 SIZE_PX = 480
@@ -54,15 +52,39 @@ PCT_MAX = 22.0
 r_small, r_big = 0.22, 0.95
 r = r_small + np.clip(vals / PCT_MAX, 0, 1) * (r_big - r_small)
 
-# Enhanced color palette
-def pct_color(v):
-    if v >= 17.0:
-        return (0.95, 0.25, 0.30)   # Vibrant red
-    if v >= 9.0:
-        return (1.00, 0.60, 0.10)   # Rich orange
-    if v >= 6.0:
-        return (1.00, 0.80, 0.35)   # Warm light orange
-    return (0.35, 0.85, 0.45)       # Fresh green
+# Circle sampling, shared by every frame
+N_THETA = 128  # already sub-pixel at this output size
+theta_full = np.linspace(0, 2*np.pi, N_THETA, dtype=np.float32)
+
+# Wiggle basis: sin(5θ + φ) = sin5θ·cosφ + cos5θ·sinφ
+wiggle_sin = np.sin(theta_full * 5)
+wiggle_cos = np.cos(theta_full * 5)
+
+# Hand-drawn feel: a fixed low-harmonic radial jitter per day, baked into
+# the radii instead of running matplotlib's sketch filter on every draw
+rng = np.random.default_rng(1404)
+harmonics = np.arange(2, 8)
+amp = rng.normal(scale=0.002, size=(n, len(harmonics), 1))
+shift = rng.uniform(0, 2*np.pi, size=(n, len(harmonics), 1))
+r_sketch = (r[:, None] + (amp * np.sin(harmonics[:, None] * theta_full + shift)).sum(axis=1)).astype(np.float32)
+
+# Enhanced color palette, indexed by bucket: <6, 6..9, 9..17, >=17
+palette = np.array([
+    [0.35, 0.85, 0.45],   # Fresh green
+    [1.00, 0.80, 0.35],   # Warm light orange
+    [1.00, 0.60, 0.10],   # Rich orange
+    [0.95, 0.25, 0.30],   # Vibrant red
+])
+bins = np.array([6.0, 9.0, 17.0])
+color_idx = np.searchsorted(bins, vals, side='right')
+colors = [tuple(c) for c in palette[color_idx]]
+
+# Status name/color per bucket, in the same order as the palette
+status_names = ["EXCELLENT", "MODERATE", "WARNING", "CRITICAL"]
+status_colors = ["#35d555", "#ffcc66", "#ff9922", "#ff3344"]
+statuses = [(status_names[c], status_colors[c]) for c in color_idx]
+
+pct_texts = [f"{v:.2f}%" for v in vals]
 
 def lerp(a, b, t):
     return a + (b - a) * t
@@ -122,7 +144,8 @@ main_text = ax.text(
     color="#ffffff",
     fontsize=20,
     fontweight="bold",
-    alpha=0.95
+    alpha=0.95,
+    animated=True
 )
 
 # Status indicator
@@ -133,7 +156,8 @@ status_text = ax.text(
     color="#35d555",
     fontsize=8,
     fontweight="bold",
-    alpha=0.9
+    alpha=0.9,
+    animated=True
 )
 
 # DATE AT BOTTOM
@@ -143,7 +167,8 @@ date_text = ax.text(
     ha="center", va="center",
     color="#aaaaaa",
     fontsize=10,
-    alpha=0.9
+    alpha=0.9,
+    animated=True
 )
 
 # ---------- CLOCKWISE DRAWING ANIMATION ----------
@@ -153,27 +178,26 @@ glow_lines = []
 
 for _ in range(TRAIL):
     # Main line
-    ln, = ax.plot([], [], lw=2.0, alpha=0.0, zorder=3)
-    ln.set_sketch_params(scale=0.6, length=80, randomness=1.2)
+    ln, = ax.plot([], [], lw=2.0, alpha=0.0, zorder=3, animated=True)
     trail_lines.append(ln)
     
     # Glow effect
-    glow, = ax.plot([], [], lw=5.0, alpha=0.0, zorder=2)
-    glow.set_sketch_params(scale=0.6, length=80, randomness=1.2)
+    glow, = ax.plot([], [], lw=5.0, alpha=0.0, zorder=2, animated=True)
     glow_lines.append(glow)
 
+# Draw order of the animated artists: glows under the texts under the lines
+animated_artists = glow_lines + [main_text, status_text, date_text] + trail_lines
+
 FRAMES_PER_ITEM = 35  # Longer animation for smooth clockwise drawing
 HOLD_FRAMES = 8  # Hold complete circle briefly
 total_frames = n * (FRAMES_PER_ITEM + HOLD_FRAMES)
 
-def get_status(v):
-    if v >= 17.0:
-        return "CRITICAL", "#ff3344"
-    if v >= 9.0:
-        return "WARNING", "#ff9922"
-    if v >= 6.0:
-        return "MODERATE", "#ffcc66"
-    return "EXCELLENT", "#35d555"
+# Wiggle phase (0.1 rad per frame) of every frame; float32 like the circle tables
+phase_cos = np.cos(np.arange(total_frames) * 0.1).astype(np.float32)
+phase_sin = np.sin(np.arange(total_frames) * 0.1).astype(np.float32)
+
+# Day whose texts are currently shown
+last_drawn = {"i": -1}
 
 def init():
     for ln, glow in zip(trail_lines, glow_lines):
@@ -181,7 +205,8 @@ def init():
         ln.set_alpha(0.0)
         glow.set_data([], [])
         glow.set_alpha(0.0)
-    return trail_lines + glow_lines + [title_text, subtitle_text, main_text, date_text, status_text]
+    last_drawn["i"] = -1
+    return animated_artists
 
 def update(frame):
     item_frame = frame % (FRAMES_PER_ITEM + HOLD_FRAMES)
@@ -196,9 +221,10 @@ def update(frame):
         draw_progress = 1.0  # Fully drawn, holding
     
     # Number of points to draw for clockwise animation
-    num_points = 1000
-    theta_full = np.linspace(0, 2*np.pi, num_points)
-    points_to_draw = int(num_points * draw_progress)
+    points_to_draw = int(N_THETA * draw_progress)
+    
+    # Subtle wiggle, same phase for every trail line
+    wiggle = 0.003 * (wiggle_sin * phase_cos[frame] + wiggle_cos * phase_sin[frame])
     
     # Clear all lines
     for ln, glow in zip(trail_lines, glow_lines):
@@ -216,17 +242,15 @@ def update(frame):
         if j < i:
             # Previous circles - fully drawn with fade
             theta = theta_full
-            wiggle = 0.003 * np.sin(theta * 5 + frame * 0.1)
-            rr = np.full_like(theta, r[j]) + wiggle
+            rr = r_sketch[j] + wiggle
         else:
             # Current circle - drawing clockwise
             if points_to_draw < 2:
                 continue
             theta = theta_full[:points_to_draw]
-            wiggle = 0.003 * np.sin(theta * 5 + frame * 0.1)
-            rr = np.full(len(theta), r[j]) + wiggle
+            rr = r_sketch[j, :points_to_draw] + wiggle[:points_to_draw]
         
-        color = pct_color(vals[j])
+        color = colors[j]
         
         # Fade based on position in trail
         if j < i:
@@ -260,19 +284,43 @@ def update(frame):
         status_text.set_alpha(alpha * 0.9)
         date_text.set_alpha(alpha * 0.9)
     
-    main_text.set_text(f"{vals[i]:.2f}%")
-    main_text.set_color(pct_color(vals[i]))
-    date_text.set_text(labels[i])
-    
-    stat, stat_color = get_status(vals[i])
-    status_text.set_text(stat)
-    status_text.set_color(stat_color)
+    # Texts only change when a new day starts
+    if i != last_drawn["i"]:
+        main_text.set_text(pct_texts[i])
+        main_text.set_color(colors[i])
+        date_text.set_text(labels[i])
+        
+        stat, stat_color = statuses[i]
+        status_text.set_text(stat)
+        status_text.set_color(stat_color)
+        last_drawn["i"] = i
     
-    return (trail_lines + glow_lines + 
-            [title_text, subtitle_text, main_text, date_text, status_text])
+    return animated_artists
 
 # ---------- SAVE ----------
-anim = FuncAnimation(fig, update, frames=total_frames, init_func=init, blit=True)
-anim.save(OUT_MP4, writer=FFMpegWriter(fps=FPS, bitrate=4000))
+# Guide rings, centre glow and titles are static: render them once, then
+# each frame restores that background and draws only the animated artists.
+fig.canvas.draw()
+background = fig.canvas.copy_from_bbox(fig.bbox)
+width, height = fig.canvas.get_width_height()
+
+# Stream raw RGBA frames straight into an ffmpeg pipe
+proc = subprocess.Popen([
+    "ffmpeg", "-y",
+    "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(FPS),
+    "-i", "-",
+    "-c:v", "libx264", "-preset", "veryfast", "-crf", "20", "-pix_fmt", "yuv420p",
+    OUT_MP4,
+], stdin=subprocess.PIPE)
+
+init()
+for frame in range(total_frames):
+    artists = update(frame)
+    fig.canvas.restore_region(background)
+    for artist in artists:
+        fig.draw_artist(artist)
+    proc.stdin.write(fig.canvas.buffer_rgba())
+proc.stdin.close()
+proc.wait()
 print(f"✓ Premium clockwise animation saved: {OUT_MP4}")
 plt.close()
\ No newline at end of file
@@ -1,9 +1,11 @@
+import subprocess
+
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, FFMpegWriter
 import matplotlib as mpl
 from matplotlib import font_manager
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 # ---------- PREMIUM FONT SETUP ----------
 def set_english_font():
@@ -50,17 +52,35 @@ if n == 0:
 # Scale settings
 PCT_MAX = 22.0
 r_small, r_big = 0.22, 0.95
-r = r_small + np.clip(vals / PCT_MAX, 0, 1) * (r_big - r_small)
-
-# Enhanced color palette
-def pct_color(v):
-    if v >= 17.0:
-        return (0.95, 0.25, 0.30)   # Vibrant red
-    if v >= 9.0:
-        return (1.00, 0.60, 0.10)   # Rich orange
-    if v >= 6.0:
-        return (1.00, 0.80, 0.35)   # Warm light orange
-    return (0.35, 0.85, 0.45)       # Fresh green
+r = (r_small + np.clip(vals / PCT_MAX, 0, 1) * (r_big - r_small)).astype(np.float32)
+
+# Circle vertices, one row per day; the phases only change z and the view
+N_THETA = 128  # already sub-pixel at this output size
+# (float32 is plenty for screen coordinates and halves the table)
+theta_full = np.linspace(0, 2*np.pi, N_THETA, dtype=np.float32)
+xs = r[:, None] * np.cos(theta_full)
+ys = r[:, None] * np.sin(theta_full)
+
+# (n, N_THETA, 3) vertices stacked at unit z spacing; phases only scale z
+circle_xyz = np.stack([xs, ys, np.broadcast_to(np.arange(n, dtype=np.float32)[:, None], xs.shape)], axis=-1)
+
+# Enhanced color palette, indexed by bucket: <6, 6..9, 9..17, >=17
+palette = np.array([
+    [0.35, 0.85, 0.45],   # Fresh green
+    [1.00, 0.80, 0.35],   # Warm light orange
+    [1.00, 0.60, 0.10],   # Rich orange
+    [0.95, 0.25, 0.30],   # Vibrant red
+])
+bins = np.array([6.0, 9.0, 17.0])
+color_idx = np.searchsorted(bins, vals, side='right')
+colors = [tuple(c) for c in palette[color_idx]]
+
+# Status name/color per bucket, in the same order as the palette
+status_names = ["EXCELLENT", "MODERATE", "WARNING", "CRITICAL"]
+status_colors = ["#35d555", "#ffcc66", "#ff9922", "#ff3344"]
+statuses = [(status_names[c], status_colors[c]) for c in color_idx]
+
+pct_texts = [f"{v:.2f}%" for v in vals]
 
 def lerp(a, b, t):
     return a + (b - a) * t
@@ -81,6 +101,11 @@ HOLD_FRAMES = 60        # Hold final view
 
 total_frames = PHASE1_FRAMES + PHASE2_FRAMES + PHASE3_FRAMES + HOLD_FRAMES
 
+# Phase of every frame (0-2 = PHASE 1-3, 3 = HOLD) and where each phase starts
+PHASE_BOUNDS = np.cumsum([0, PHASE1_FRAMES, PHASE2_FRAMES, PHASE3_FRAMES, HOLD_FRAMES])
+PHASE_LEN = np.diff(PHASE_BOUNDS)
+PHASE_OF = np.searchsorted(PHASE_BOUNDS, np.arange(total_frames), side='right') - 1
+
 # ---------- FIGURE SETUP ----------
 fig = plt.figure(figsize=(SIZE_PX / DPI, SIZE_PX / DPI), dpi=DPI)
 fig.patch.set_facecolor("#0a0a0a")
@@ -118,37 +143,42 @@ status_text = fig.text(0.5, 0.44, "", ha="center", va="center",
 date_text = fig.text(0.5, 0.06, "", ha="center", va="center",
                      color="#aaaaaa", fontsize=10, alpha=0.9)
 
-# Store line objects
-lines = []
-date_labels_3d = []
+# All day circles live in one collection; each phase picks what it shows
+circles = Line3DCollection([])
+ax.add_collection(circles, autolim=False)
+ax.computed_zorder = False  # keep the circles under the date labels
+circle_rgba = np.column_stack([palette[color_idx], np.ones(n)])  # alpha set per phase
+
+# Persistent side labels, one per day, shown as needed
+date_labels_3d = [ax.text(1.0, 0, i * 0.08, labels[i], color="#aaaaaa", fontsize=6, visible=False)
+                  for i in range(n)]
 
-def get_status(v):
-    if v >= 17.0:
-        return "CRITICAL", "#ff3344"
-    if v >= 9.0:
-        return "WARNING", "#ff9922"
-    if v >= 6.0:
-        return "MODERATE", "#ffcc66"
-    return "EXCELLENT", "#35d555"
+def show_circles(count, z_spacing, alpha, lw):
+    """Show the first count days' circles, stacked z_spacing apart"""
+    circle_rgba[:count, 3] = alpha
+    circles.set_segments(circle_xyz[:count] * np.float32([1.0, 1.0, z_spacing]))
+    circles.set_color(circle_rgba[:count])
+    circles.set_linewidth(lw)
+
+# Day whose texts are currently shown
+last_drawn = {"i": -1}
 
 def init():
-    return lines + [title_text, subtitle_text, main_text, date_text, status_text]
+    last_drawn["i"] = -1
+    return [circles, title_text, subtitle_text, main_text, date_text, status_text]
 
 def update(frame):
-    # Clear previous lines
-    for line in lines:
-        line.remove()
-    lines.clear()
-    
+    # Hide the labels; each phase shows what it needs
     for txt in date_labels_3d:
-        txt.remove()
-    date_labels_3d.clear()
+        txt.set_visible(False)
     
     # Determine phase
-    if frame < PHASE1_FRAMES:
+    p = PHASE_OF[frame]
+    phase_progress = (frame - PHASE_BOUNDS[p]) / PHASE_LEN[p]
+    
+    if p == 0:
         # PHASE 1: 2D spiral animation
         phase = 1
-        phase_progress = frame / PHASE1_FRAMES
         
         # Calculate which circle we're drawing
         item_idx = int(phase_progress * n)
@@ -159,33 +189,23 @@ def update(frame):
         elev = 90
         azim = 0
         
-        # Draw completed circles
-        for i in range(item_idx + 1):
-            theta = np.linspace(0, 2*np.pi, 200)
-            x = r[i] * np.cos(theta)
-            y = r[i] * np.sin(theta)
-            z = np.zeros_like(theta)
-            
-            color = pct_color(vals[i])
-            alpha = 0.8 if i == item_idx else 0.4
-            lw = 2.5 if i == item_idx else 1.5
-            
-            line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-            lines.append(line)
+        # Draw completed circles, the current one highlighted
+        current = np.arange(item_idx + 1) == item_idx
+        show_circles(item_idx + 1, 0.0, np.where(current, 0.8, 0.4), np.where(current, 2.5, 1.5))
         
-        # Update text
-        if item_idx < n:
-            main_text.set_text(f"{vals[item_idx]:.2f}%")
-            main_text.set_color(pct_color(vals[item_idx]))
+        # Update text when a new day starts
+        if item_idx != last_drawn["i"]:
+            main_text.set_text(pct_texts[item_idx])
+            main_text.set_color(colors[item_idx])
             date_text.set_text(labels[item_idx])
-            stat, stat_color = get_status(vals[item_idx])
+            stat, stat_color = statuses[item_idx]
             status_text.set_text(stat)
             status_text.set_color(stat_color)
+            last_drawn["i"] = item_idx
         
-    elif frame < PHASE1_FRAMES + PHASE2_FRAMES:
+    elif p == 1:
         # PHASE 2: Transform to 3D cylinder
         phase = 2
-        phase_progress = (frame - PHASE1_FRAMES) / PHASE2_FRAMES
         t = ease_in_out(phase_progress)
         
         # Gradually increase Z spacing and rotate view
@@ -193,54 +213,30 @@ def update(frame):
         elev = 90 - (40 * t)  # Tilt from 90 to 50 degrees
         azim = 0
         
-        for i in range(n):
-            theta = np.linspace(0, 2*np.pi, 200)
-            x = r[i] * np.cos(theta)
-            y = r[i] * np.sin(theta)
-            z = np.full_like(theta, i * z_spacing)
-            
-            color = pct_color(vals[i])
-            alpha = 0.7
-            lw = 2.0
-            
-            line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-            lines.append(line)
+        show_circles(n, z_spacing, 0.7, 2.0)
         
         # Fade out 2D text
         main_text.set_alpha(0.95 * (1 - t))
         status_text.set_alpha(0.9 * (1 - t))
         date_text.set_alpha(0.9 * (1 - t))
         
-    elif frame < PHASE1_FRAMES + PHASE2_FRAMES + PHASE3_FRAMES:
+    elif p == 2:
         # PHASE 3: Rotate to side view
         phase = 3
-        phase_progress = (frame - PHASE1_FRAMES - PHASE2_FRAMES) / PHASE3_FRAMES
         t = ease_in_out(phase_progress)
         
         z_spacing = 0.08
         elev = 50 - (50 * t)  # Tilt to 0 degrees (side view)
         azim = 0 + (0 * t)
         
-        for i in range(n):
-            theta = np.linspace(0, 2*np.pi, 200)
-            x = r[i] * np.cos(theta)
-            y = r[i] * np.sin(theta)
-            z = np.full_like(theta, i * z_spacing)
-            
-            color = pct_color(vals[i])
-            alpha = 0.8
-            lw = 2.0
-            
-            line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-            lines.append(line)
+        show_circles(n, z_spacing, 0.8, 2.0)
         
         # Add date labels in side view
         if t > 0.5:
             label_alpha = (t - 0.5) * 2
             for i in range(0, n, 3):  # Show every 3rd date
-                txt = ax.text(1.0, 0, i * z_spacing, labels[i],
-                            color="#aaaaaa", fontsize=6, alpha=label_alpha)
-                date_labels_3d.append(txt)
+                date_labels_3d[i].set_alpha(label_alpha)
+                date_labels_3d[i].set_visible(True)
         
         main_text.set_alpha(0)
         status_text.set_alpha(0)
@@ -253,24 +249,12 @@ def update(frame):
         elev = 0
         azim = 0
         
-        for i in range(n):
-            theta = np.linspace(0, 2*np.pi, 200)
-            x = r[i] * np.cos(theta)
-            y = r[i] * np.sin(theta)
-            z = np.full_like(theta, i * z_spacing)
-            
-            color = pct_color(vals[i])
-            alpha = 0.8
-            lw = 2.0
-            
-            line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-            lines.append(line)
+        show_circles(n, z_spacing, 0.8, 2.0)
         
         # Show all date labels
         for i in range(0, n, 2):
-            txt = ax.text(1.0, 0, i * z_spacing, labels[i],
-                        color="#aaaaaa", fontsize=6, alpha=0.9)
-            date_labels_3d.append(txt)
+            date_labels_3d[i].set_alpha(0.9)
+            date_labels_3d[i].set_visible(True)
         
         main_text.set_alpha(0)
         status_text.set_alpha(0)
@@ -279,10 +263,43 @@ def update(frame):
     # Update view
     ax.view_init(elev=elev, azim=azim)
     
-    return lines + date_labels_3d + [title_text, subtitle_text, main_text, date_text, status_text]
+    return [circles] + date_labels_3d + [title_text, subtitle_text, main_text, date_text, status_text]
 
 # ---------- SAVE ----------
-anim = FuncAnimation(fig, update, frames=total_frames, init_func=init, interval=1000/FPS)
-anim.save(OUT_MP4, writer=FFMpegWriter(fps=FPS, bitrate=4000))
+# PHASE 1 keeps the top-down camera fixed: render the empty scene once and
+# blit only the artists that move over it. From PHASE 2 on the camera moves
+# every frame, so those frames are full draws.
+phase1_artists = [circles, main_text, status_text, date_text]
+
+init()
+fig.canvas.draw()
+background = fig.canvas.copy_from_bbox(fig.bbox)
+width, height = fig.canvas.get_width_height()
+
+# Stream raw RGBA frames straight into an ffmpeg pipe
+proc = subprocess.Popen([
+    "ffmpeg", "-y",
+    "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(FPS),
+    "-i", "-",
+    "-c:v", "libx264", "-preset", "veryfast", "-crf", "20", "-pix_fmt", "yuv420p",
+    OUT_MP4,
+], stdin=subprocess.PIPE)
+
+# HOLD is a still image: render its first frame, then resend that buffer
+hold_start = PHASE_BOUNDS[3]
+
+for frame in range(total_frames):
+    if frame <= hold_start:
+        update(frame)
+        if PHASE_OF[frame] == 0:
+            fig.canvas.restore_region(background)
+            circles.do_3d_projection()
+            for artist in phase1_artists:
+                fig.draw_artist(artist)
+        else:
+            fig.canvas.draw()
+    proc.stdin.write(fig.canvas.buffer_rgba())
+proc.stdin.close()
+proc.wait()
 print(f"✓ 3D transformation animation saved: {OUT_MP4}")
 plt.close()
\ No newline at end of file
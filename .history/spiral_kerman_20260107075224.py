@@ -1,9 +1,11 @@
+import subprocess
+
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, FFMpegWriter
 import matplotlib as mpl
 from matplotlib import font_manager
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 # ---------- PREMIUM FONT SETUP ----------
 def set_english_font():
@@ -50,17 +52,30 @@ if n == 0:
 # Scale settings - دایره‌های بزرگتر
 PCT_MAX = 22.0
 r_small, r_big = 0.25, 1.25  # محدوده بزرگتر
-r = r_small + np.clip(vals / PCT_MAX, 0, 1) * (r_big - r_small)
-
-# Enhanced color palette
-def pct_color(v):
-    if v >= 17.0:
-        return (0.95, 0.25, 0.30)   # Vibrant red
-    if v >= 9.0:
-        return (1.00, 0.60, 0.10)   # Rich orange
-    if v >= 6.0:
-        return (1.00, 0.80, 0.35)   # Warm light orange
-    return (0.35, 0.85, 0.45)       # Fresh green
+r = (r_small + np.clip(vals / PCT_MAX, 0, 1) * (r_big - r_small)).astype(np.float32)
+
+# Circle vertices, one row per day; the phases only change z and the view
+N_THETA = 128  # already sub-pixel at this output size
+# (float32 is plenty for screen coordinates and halves the table)
+theta_full = np.linspace(0, 2*np.pi, N_THETA, dtype=np.float32)
+xs = r[:, None] * np.cos(theta_full)
+ys = r[:, None] * np.sin(theta_full)
+
+# (n, N_THETA, 3) vertices stacked at unit z spacing; phases only scale z
+circle_xyz = np.stack([xs, ys, np.broadcast_to(np.arange(n, dtype=np.float32)[:, None], xs.shape)], axis=-1)
+
+# Enhanced color palette, indexed by bucket: <6, 6..9, 9..17, >=17
+palette = np.array([
+    [0.35, 0.85, 0.45],   # Fresh green
+    [1.00, 0.80, 0.35],   # Warm light orange
+    [1.00, 0.60, 0.10],   # Rich orange
+    [0.95, 0.25, 0.30],   # Vibrant red
+])
+bins = np.array([6.0, 9.0, 17.0])
+color_idx = np.searchsorted(bins, vals, side='right')
+colors = [tuple(c) for c in palette[color_idx]]
+
+pct_texts = [f"{v:.1f}%" for v in vals]
 
 def lerp(a, b, t):
     return a + (b - a) * t
@@ -82,6 +97,11 @@ HOLD_FRAMES = 90
 
 total_frames = PHASE1_FRAMES + PHASE2_FRAMES + PHASE3_FRAMES + HOLD_FRAMES
 
+# Phase of every frame (0-2 = PHASE 1-3, 3 = HOLD) and where each phase starts
+PHASE_BOUNDS = np.cumsum([0, PHASE1_FRAMES, PHASE2_FRAMES, PHASE3_FRAMES, HOLD_FRAMES])
+PHASE_LEN = np.diff(PHASE_BOUNDS)
+PHASE_OF = np.searchsorted(PHASE_BOUNDS, np.arange(total_frames), side='right') - 1
+
 # ---------- FIGURE SETUP ----------
 fig = plt.figure(figsize=(SIZE_PX / DPI, SIZE_PX / DPI), dpi=DPI)
 fig.patch.set_facecolor("#0a0a0a")
@@ -113,39 +133,81 @@ title_text = fig.text(0.5, 0.95, TITLE_TEXT, ha="center", va="center",
 subtitle_text = fig.text(0.5, 0.91, SUBTITLE_TEXT, ha="center", va="center",
                          color="#888888", fontsize=8, alpha=0.85)
 
-# Store objects
-lines = []
-center_texts = []
-date_labels_3d = []
+# Persistent artists, shown/hidden and restyled per frame
+# Day circles in one collection, plus the circle being drawn and its glow on top
+circles = Line3DCollection([])
+ax.add_collection(circles, autolim=False)
+ax.computed_zorder = False  # keep the circles under the lines and labels drawn after them
+circle_rgba = np.column_stack([palette[color_idx], np.ones(n)])  # alpha set per phase
 
-def get_status(v):
-    if v >= 17.0:
-        return "CRITICAL", "#ff3344"
-    if v >= 9.0:
-        return "WARNING", "#ff9922"
-    if v >= 6.0:
-        return "MODERATE", "#ffcc66"
-    return "EXCELLENT", "#35d555"
+# Per-day fades: older circles dimmer, with a floor
+phase1_alpha = np.maximum(0.5 - np.arange(n) * 0.015, 0.15)
+phase2_alpha = np.maximum(0.75 - np.arange(n) * 0.01, 0.3)
+current_line = ax.plot([], [], [], visible=False)[0]
+current_glow = ax.plot([], [], [], visible=False)[0]
+
+# متن مرکز دایره: درصد و تاریخ
+center_pct = ax.text(0, 0, 0.01, "", fontsize=14, fontweight='bold',
+                     ha='center', va='center', visible=False)
+center_date = ax.text(0, 0, -0.05, "", color="#aaaaaa", fontsize=8,
+                      ha='center', va='top', visible=False)
+center_texts = [center_pct, center_date]
+
+# تاریخ‌ها در کنار استوانه
+date_labels_3d = [
+    ax.text(1.5, 0, 0, labels[i],
+            color="#ffffff", fontsize=7,
+            ha='left', va='center', visible=False,
+            bbox=dict(boxstyle='round,pad=0.3',
+                      facecolor='#1a1a1a',
+                      edgecolor='none',
+                      alpha=0.8))
+    for i in range(n)
+]
+
+def show_circles(count, z_spacing, alpha, lw):
+    """Show the first count days' circles, stacked z_spacing apart"""
+    circle_rgba[:count, 3] = alpha
+    circles.set_segments(circle_xyz[:count] * np.float32([1.0, 1.0, z_spacing]))
+    circles.set_color(circle_rgba[:count])
+    circles.set_linewidth(lw)
+
+def show_line(line, x, y, z, color, alpha, lw):
+    """Move a persistent circle line to new data/style and make it visible"""
+    line.set_data_3d(x, y, z)
+    line.set_color(color)
+    line.set_alpha(alpha)
+    line.set_linewidth(lw)
+    line.set_visible(True)
+
+# Placement/alpha the side labels were last given; constant in PHASE 3/HOLD
+last_labels = {"style": None}
+
+def show_date_labels(z_spacing, alpha, box_alpha):
+    """Place every side date label at its circle's height and show it"""
+    style = (z_spacing, alpha, box_alpha)
+    if style != last_labels["style"]:
+        for i, txt in enumerate(date_labels_3d):
+            txt.set_position_3d((1.5, 0, i * z_spacing))
+            txt.set_alpha(alpha)
+            txt.get_bbox_patch().set_alpha(box_alpha)
+        last_labels["style"] = style
+    for txt in date_labels_3d:
+        txt.set_visible(True)
 
 def init():
-    return lines + center_texts + [title_text, subtitle_text]
+    return [circles, current_line, current_glow] + center_texts + [title_text, subtitle_text]
 
 def update(frame):
-    # Clear previous objects
-    for line in lines:
-        line.remove()
-    lines.clear()
-    
-    for txt in center_texts:
-        txt.remove()
-    center_texts.clear()
-    
-    for txt in date_labels_3d:
-        txt.remove()
-    date_labels_3d.clear()
+    # Hide everything; each phase shows what it needs
+    for artist in [current_line, current_glow] + center_texts + date_labels_3d:
+        artist.set_visible(False)
     
     # Determine phase
-    if frame < PHASE1_FRAMES:
+    p = PHASE_OF[frame]
+    phase_progress = (frame - PHASE_BOUNDS[p]) / PHASE_LEN[p]
+    
+    if p == 0:
         # PHASE 1: 2D spiral animation
         circle_idx = frame // FRAMES_PER_CIRCLE
         circle_progress = (frame % FRAMES_PER_CIRCLE) / FRAMES_PER_CIRCLE
@@ -159,129 +221,68 @@ def update(frame):
         azim = -90
         
         # رسم دایره‌های قبلی
-        for i in range(circle_idx):
-            theta = np.linspace(0, 2*np.pi, 200)
-            x = r[i] * np.cos(theta)
-            y = r[i] * np.sin(theta)
-            z = np.zeros_like(theta)
-            
-            color = pct_color(vals[i])
-            alpha = 0.5 - (i * 0.015)
-            alpha = max(alpha, 0.15)
-            lw = 2.5
-            
-            line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-            lines.append(line)
+        show_circles(circle_idx, 0.0, phase1_alpha[:circle_idx], 2.5)
         
         # رسم دایره فعلی
         if circle_idx < n:
-            num_points = int(200 * circle_progress)
+            num_points = int(N_THETA * circle_progress)
             if num_points >= 2:
-                theta = np.linspace(0, 2*np.pi * circle_progress, num_points)
-                x = r[circle_idx] * np.cos(theta)
-                y = r[circle_idx] * np.sin(theta)
-                z = np.zeros_like(theta)
+                x = xs[circle_idx, :num_points]
+                y = ys[circle_idx, :num_points]
+                z = np.zeros(num_points)
                 
-                color = pct_color(vals[circle_idx])
+                color = colors[circle_idx]
                 alpha = 0.95
                 lw = 3.0
                 
-                line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-                lines.append(line)
+                show_line(current_line, x, y, z, color, alpha, lw)
                 
                 # Glow effect
-                line_glow = ax.plot(x, y, z, color=color, alpha=0.3, lw=7.0)[0]
-                lines.append(line_glow)
+                show_line(current_glow, x, y, z, color, 0.3, 7.0)
             
             # نمایش متن در مرکز دایره (در مرکز صفحه)
             if circle_progress > 0.5:
                 text_alpha = (circle_progress - 0.5) / 0.5
                 
                 # درصد در مرکز
-                txt_pct = ax.text(0, 0, 0.01, f"{vals[circle_idx]:.1f}%",
-                                color=pct_color(vals[circle_idx]),
-                                fontsize=14, fontweight='bold',
-                                ha='center', va='center',
-                                alpha=text_alpha * 0.95)
-                center_texts.append(txt_pct)
+                center_pct.set_text(pct_texts[circle_idx])
+                center_pct.set_color(colors[circle_idx])
+                center_pct.set_alpha(text_alpha * 0.95)
+                center_pct.set_visible(True)
                 
                 # تاریخ زیر درصد
-                txt_date = ax.text(0, 0, -0.05, labels[circle_idx],
-                                 color="#aaaaaa",
-                                 fontsize=8,
-                                 ha='center', va='top',
-                                 alpha=text_alpha * 0.85)
-                center_texts.append(txt_date)
+                center_date.set_text(labels[circle_idx])
+                center_date.set_alpha(text_alpha * 0.85)
+                center_date.set_visible(True)
         
-    elif frame < PHASE1_FRAMES + PHASE2_FRAMES:
+    elif p == 1:
         # PHASE 2: Transform to 3D cylinder
-        phase_progress = (frame - PHASE1_FRAMES) / PHASE2_FRAMES
         t = ease_in_out(phase_progress)
         
         z_spacing = 0.12 * t
         elev = 90 - (45 * t)
         azim = -90 + (15 * t)
         
-        for i in range(n):
-            theta = np.linspace(0, 2*np.pi, 200)
-            x = r[i] * np.cos(theta)
-            y = r[i] * np.sin(theta)
-            z = np.full_like(theta, i * z_spacing)
-            
-            color = pct_color(vals[i])
-            alpha = 0.75 - (i * 0.01)
-            alpha = max(alpha, 0.3)
-            lw = 2.5
-            
-            line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-            lines.append(line)
+        show_circles(n, z_spacing, phase2_alpha, 2.5)
         
         # نمایش تاریخ‌ها در کنار استوانه با فاصله مشخص
         if t > 0.3:
             label_alpha = min(1.0, (t - 0.3) / 0.4)
-            for i in range(n):
-                # تاریخ‌ها در سمت راست با فاصله از استوانه
-                txt = ax.text(1.5, 0, i * z_spacing, labels[i],
-                            color="#ffffff", fontsize=7, alpha=label_alpha * 0.9,
-                            ha='left', va='center',
-                            bbox=dict(boxstyle='round,pad=0.3', 
-                                    facecolor='#1a1a1a', 
-                                    edgecolor='none',
-                                    alpha=0.7))
-                date_labels_3d.append(txt)
+            # تاریخ‌ها در سمت راست با فاصله از استوانه
+            show_date_labels(z_spacing, label_alpha * 0.9, 0.7)
         
-    elif frame < PHASE1_FRAMES + PHASE2_FRAMES + PHASE3_FRAMES:
+    elif p == 2:
         # PHASE 3: Rotate to side view
-        phase_progress = (frame - PHASE1_FRAMES - PHASE2_FRAMES) / PHASE3_FRAMES
         t = ease_in_out(phase_progress)
         
         z_spacing = 0.12
         elev = 45 - (45 * t)
         azim = -75 + (75 * t)
         
-        for i in range(n):
-            theta = np.linspace(0, 2*np.pi, 200)
-            x = r[i] * np.cos(theta)
-            y = r[i] * np.sin(theta)
-            z = np.full_like(theta, i * z_spacing)
-            
-            color = pct_color(vals[i])
-            alpha = 0.85
-            lw = 2.8
-            
-            line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-            lines.append(line)
+        show_circles(n, z_spacing, 0.85, 2.8)
         
         # تاریخ‌ها در کنار با background برای خوانایی بهتر
-        for i in range(n):
-            txt = ax.text(1.5, 0, i * z_spacing, labels[i],
-                        color="#ffffff", fontsize=7, alpha=0.9,
-                        ha='left', va='center',
-                        bbox=dict(boxstyle='round,pad=0.3', 
-                                facecolor='#1a1a1a', 
-                                edgecolor='none',
-                                alpha=0.8))
-            date_labels_3d.append(txt)
+        show_date_labels(z_spacing, 0.9, 0.8)
         
     else:
         # HOLD final view
@@ -289,37 +290,52 @@ def update(frame):
         elev = 0
         azim = 0
         
-        for i in range(n):
-            theta = np.linspace(0, 2*np.pi, 200)
-            x = r[i] * np.cos(theta)
-            y = r[i] * np.sin(theta)
-            z = np.full_like(theta, i * z_spacing)
-            
-            color = pct_color(vals[i])
-            alpha = 0.85
-            lw = 2.8
-            
-            line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-            lines.append(line)
+        show_circles(n, z_spacing, 0.85, 2.8)
         
         # تاریخ‌ها با background مشکی برای جدا شدن از رنگ‌ها
-        for i in range(n):
-            txt = ax.text(1.5, 0, i * z_spacing, labels[i],
-                        color="#ffffff", fontsize=7, alpha=0.9,
-                        ha='left', va='center',
-                        bbox=dict(boxstyle='round,pad=0.3', 
-                                facecolor='#1a1a1a', 
-                                edgecolor='none',
-                                alpha=0.8))
-            date_labels_3d.append(txt)
+        show_date_labels(z_spacing, 0.9, 0.8)
     
     # Update view smoothly
     ax.view_init(elev=elev, azim=azim)
     
-    return lines + center_texts + date_labels_3d + [title_text, subtitle_text]
+    return ([circles, current_line, current_glow] + center_texts + date_labels_3d +
+            [title_text, subtitle_text])
 
 # ---------- SAVE ----------
-anim = FuncAnimation(fig, update, frames=total_frames, init_func=init, interval=1000/FPS, blit=False)
-anim.save(OUT_MP4, writer=FFMpegWriter(fps=FPS, bitrate=5000))
+# PHASE 1 keeps the top-down camera fixed: render the empty scene once and
+# blit only the artists that move over it. From PHASE 2 on the camera moves
+# every frame, so those frames are full draws.
+phase1_artists = [circles, current_line, current_glow] + center_texts
+
+init()
+fig.canvas.draw()
+background = fig.canvas.copy_from_bbox(fig.bbox)
+width, height = fig.canvas.get_width_height()
+
+# Stream raw RGBA frames straight into an ffmpeg pipe
+proc = subprocess.Popen([
+    "ffmpeg", "-y",
+    "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(FPS),
+    "-i", "-",
+    "-c:v", "libx264", "-preset", "veryfast", "-crf", "20", "-pix_fmt", "yuv420p",
+    OUT_MP4,
+], stdin=subprocess.PIPE)
+
+# HOLD is a still image: render its first frame, then resend that buffer
+hold_start = PHASE_BOUNDS[3]
+
+for frame in range(total_frames):
+    if frame <= hold_start:
+        update(frame)
+        if PHASE_OF[frame] == 0:
+            fig.canvas.restore_region(background)
+            circles.do_3d_projection()
+            for artist in phase1_artists:
+                fig.draw_artist(artist)
+        else:
+            fig.canvas.draw()
+    proc.stdin.write(fig.canvas.buffer_rgba())
+proc.stdin.close()
+proc.wait()
 print(f"✓ Premium 3D transformation animation saved: {OUT_MP4}")
 plt.close()
\ No newline at end of file
@@ -1,9 +1,15 @@
+import multiprocessing
+import os
+import subprocess
+
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # frames only ever go to the MP4, no GUI needed
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, FFMpegWriter
 import matplotlib as mpl
 from matplotlib import font_manager
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 # ---------- PREMIUM FONT SETUP ----------
 def set_english_font():
@@ -18,6 +24,11 @@ def set_english_font():
 
 set_english_font()
 
+# Let Agg drop sub-pixel vertices and rasterise long paths in chunks
+mpl.rcParams["path.simplify"] = True
+mpl.rcParams["path.simplify_threshold"] = 1.0
+mpl.rcParams["agg.path.chunksize"] = 10000
+
 # ---------- SETTINGS ----------
 FPS = 30
 SIZE_PX = 720
@@ -52,15 +63,40 @@ PCT_MAX = 22.0
 r_small, r_big = 0.35, 1.1
 r = r_small + np.clip(vals / PCT_MAX, 0, 1) * (r_big - r_small)
 
-# Enhanced color palette
-def pct_color(v):
-    if v >= 17.0:
-        return (0.95, 0.25, 0.30)   # Vibrant red
-    if v >= 9.0:
-        return (1.00, 0.60, 0.10)   # Rich orange
-    if v >= 6.0:
-        return (1.00, 0.80, 0.35)   # Warm light orange
-    return (0.35, 0.85, 0.45)       # Fresh green
+# Unit circle shared by every ring and frame (float32 is plenty for screen
+# coordinates and halves what goes through the 3D projection)
+N_THETA = 128  # already sub-pixel at this output size
+THETA = np.linspace(0, 2*np.pi, N_THETA, dtype=np.float32)
+COS_T = np.cos(THETA)
+SIN_T = np.sin(THETA)
+Z0 = np.zeros(N_THETA, dtype=np.float32)
+
+# Ring vertices, one (n, N_THETA) row per day; ring_xyz stacks them at unit
+# z spacing, which the phases scale by z_spacing
+ring_x = r.astype(np.float32)[:, None] * COS_T
+ring_y = r.astype(np.float32)[:, None] * SIN_T
+ring_z = np.broadcast_to(np.arange(n, dtype=np.float32)[:, None], ring_x.shape)
+ring_xyz = np.stack([ring_x, ring_y, ring_z], axis=-1)
+ring_segments = np.empty_like(ring_xyz)  # ring_xyz scaled to the current spacing
+
+# Enhanced color palette, indexed by bucket: <6, 6..9, 9..17, >=17
+palette = np.array([
+    [0.35, 0.85, 0.45],   # Fresh green
+    [1.00, 0.80, 0.35],   # Warm light orange
+    [1.00, 0.60, 0.10],   # Rich orange
+    [0.95, 0.25, 0.30],   # Vibrant red
+])
+bins = np.array([6.0, 9.0, 17.0])
+
+# Per-day colors and the fading alphas of PHASE 1 / PHASE 2
+colors = palette[np.searchsorted(bins, vals, side='right')]
+alpha_phase1 = np.maximum(0.5 - 0.015 * np.arange(n), 0.15)
+alpha_phase2 = np.maximum(0.75 - 0.01 * np.arange(n), 0.3)
+ring_rgba = np.column_stack([colors, np.ones(n)])
+
+# ---------- RENDER WORKERS ----------
+WORKERS = os.cpu_count() or 1  # processes rendering frames
+FRAME_CHUNK = 30               # consecutive frames handed to a worker at once
 
 def lerp(a, b, t):
     return a + (b - a) * t
@@ -82,6 +118,25 @@ HOLD_FRAMES = 90
 
 total_frames = PHASE1_FRAMES + PHASE2_FRAMES + PHASE3_FRAMES + HOLD_FRAMES
 
+# ---------- FRAME SCHEDULE ----------
+# Phase (0-2 = PHASE 1-3, 3 = HOLD), easing and camera of every frame
+PHASE_BOUNDS = np.cumsum([0, PHASE1_FRAMES, PHASE2_FRAMES, PHASE3_FRAMES, HOLD_FRAMES])
+# (start, end) of each phase, interpolated with its eased progress
+ELEV_RANGE = np.array([(90, 90), (90, 45), (45, 0), (0, 0)])
+AZIM_RANGE = np.array([(-90, -90), (-90, -75), (-75, 0), (0, 0)])
+Z_SPACING_RANGE = np.array([(0, 0), (0, 0.1), (0.1, 0.1), (0.1, 0.1)])
+
+frame_idx = np.arange(total_frames)
+frame_phase = np.searchsorted(PHASE_BOUNDS, frame_idx, side='right') - 1
+frame_t = ease_in_out((frame_idx - PHASE_BOUNDS[frame_phase]) / np.diff(PHASE_BOUNDS)[frame_phase])
+frame_elev = lerp(ELEV_RANGE[frame_phase, 0], ELEV_RANGE[frame_phase, 1], frame_t)
+frame_azim = lerp(AZIM_RANGE[frame_phase, 0], AZIM_RANGE[frame_phase, 1], frame_t)
+frame_z_spacing = lerp(Z_SPACING_RANGE[frame_phase, 0], Z_SPACING_RANGE[frame_phase, 1], frame_t)
+
+# PHASE 1: ring being drawn and its eased drawing progress
+frame_circle = frame_idx // FRAMES_PER_CIRCLE
+frame_circle_progress = ease_out_cubic((frame_idx % FRAMES_PER_CIRCLE) / FRAMES_PER_CIRCLE)
+
 # ---------- FIGURE SETUP ----------
 fig = plt.figure(figsize=(SIZE_PX / DPI, SIZE_PX / DPI), dpi=DPI)
 fig.patch.set_facecolor("#0a0a0a")
@@ -118,77 +173,89 @@ main_text = fig.text(0.5, 0.5, "", ha="center", va="center",
 date_text = fig.text(0.5, 0.08, "", ha="center", va="center",
                      color="#aaaaaa", fontsize=7, alpha=0.0)
 
-# Store line objects
-lines = []
-date_labels_3d = []
+# The finished day rings, one collection in every phase, plus the ring
+# being drawn and its glow
+rings = Line3DCollection([])
+ax.add_collection(rings, autolim=False)
+ax.computed_zorder = False  # keep the rings under the lines
+current_line = ax.plot([], [], [], lw=2.8)[0]
+current_glow = ax.plot([], [], [], lw=6.0)[0]
+all_lines = [rings, current_line, current_glow]
+
+# Side-view date labels for every other day, at the final ring heights
+date_labels_3d = [ax.text(1.5, 0, i * 0.1, labels[i], color="#aaaaaa", fontsize=7,
+                          ha='left', visible=False)
+                  for i in range(0, n, 2)]
+
+# (count, z_spacing, alpha, lw) the rings were last given; they stay put
+# for a whole PHASE 1 circle and through PHASE 3/HOLD. Per-day alpha tables
+# are keyed by identity, so pass the whole table, not a slice of it.
+last_rings = {"style": None}
+
+def show_rings(count, z_spacing, alpha, lw):
+    """Show the first count day rings, stacked z_spacing apart; alpha is a
+    scalar or a per-day table"""
+    style = (count, z_spacing, alpha if np.isscalar(alpha) else id(alpha), lw)
+    if style != last_rings["style"]:
+        ring_rgba[:count, 3] = np.broadcast_to(alpha, n)[:count]
+        segments = ring_segments[:count]
+        np.multiply(ring_xyz[:count], np.float32([1.0, 1.0, z_spacing]), out=segments)
+        rings.set_segments(segments)
+        rings.set_color(ring_rgba[:count])
+        rings.set_linewidth(lw)
+        last_rings["style"] = style
+    rings.set_visible(True)
 
 def init():
-    return lines + [title_text, subtitle_text, main_text, date_text]
+    for artist in all_lines + date_labels_3d:
+        artist.set_visible(False)
+    last_rings["style"] = None
+    return all_lines + [title_text, subtitle_text, main_text, date_text]
 
 def update(frame):
-    # Clear previous lines
-    for line in lines:
-        line.remove()
-    lines.clear()
+    # Hide the lines and labels; each phase shows what it needs
+    for artist in all_lines + date_labels_3d:
+        artist.set_visible(False)
     
-    for txt in date_labels_3d:
-        txt.remove()
-    date_labels_3d.clear()
+    # Look up the frame's phase and eased progress
+    phase = frame_phase[frame]
+    t = frame_t[frame]
+    z_spacing = frame_z_spacing[frame]
     
-    # Determine phase
-    if frame < PHASE1_FRAMES:
+    if phase == 0:
         # PHASE 1: 2D spiral animation
-        circle_idx = frame // FRAMES_PER_CIRCLE
-        circle_progress = (frame % FRAMES_PER_CIRCLE) / FRAMES_PER_CIRCLE
-        circle_progress = ease_out_cubic(circle_progress)
-        
-        if circle_idx >= n:
-            circle_idx = n - 1
-            circle_progress = 1.0
-        
-        elev = 90
-        azim = -90
+        circle_idx = frame_circle[frame]
+        circle_progress = frame_circle_progress[frame]
         
         # رسم دایره‌های قبلی
-        for i in range(circle_idx):
-            theta = np.linspace(0, 2*np.pi, 200)
-            x = r[i] * np.cos(theta)
-            y = r[i] * np.sin(theta)
-            z = np.zeros_like(theta)
-            
-            color = pct_color(vals[i])
-            alpha = 0.5 - (i * 0.015)
-            alpha = max(alpha, 0.15)
-            lw = 2.0
-            
-            line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-            lines.append(line)
+        show_rings(circle_idx, 0.0, alpha_phase1, 2.0)
         
         # رسم دایره فعلی
         if circle_idx < n:
-            num_points = int(200 * circle_progress)
+            num_points = int(N_THETA * circle_progress)
             if num_points >= 2:
-                theta = np.linspace(0, 2*np.pi * circle_progress, num_points)
-                x = r[circle_idx] * np.cos(theta)
-                y = r[circle_idx] * np.sin(theta)
-                z = np.zeros_like(theta)
+                x = ring_x[circle_idx, :num_points]
+                y = ring_y[circle_idx, :num_points]
+                z = Z0[:num_points]
                 
-                color = pct_color(vals[circle_idx])
-                alpha = 0.95
-                lw = 2.8
+                color = colors[circle_idx]
                 
-                line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-                lines.append(line)
+                current_line.set_data_3d(x, y, z)
+                current_line.set_color(color)
+                current_line.set_alpha(0.95)
+                current_line.set_visible(True)
                 
                 # Glow effect
-                line_glow = ax.plot(x, y, z, color=color, alpha=0.3, lw=6.0)[0]
-                lines.append(line_glow)
+                current_glow.set_data_3d(x, y, z)
+                current_glow.set_color(color)
+                current_glow.set_alpha(0.3)
+                current_glow.set_visible(True)
             
             # نمایش متن در مرکز و تاریخ در پایین
             if circle_progress > 0.7:
                 text_alpha = (circle_progress - 0.7) / 0.3
                 main_text.set_text(f"{vals[circle_idx]:.1f}%")
-                main_text.set_color(pct_color(vals[circle_idx]))
+                main_text.set_color(colors[circle_idx])
                 main_text.set_alpha(text_alpha * 0.8)
                 date_text.set_text(labels[circle_idx])
                 date_text.set_alpha(text_alpha * 0.7)
@@ -200,102 +267,108 @@ def update(frame):
                 main_text.set_alpha(0)
                 date_text.set_alpha(0)
         
-    elif frame < PHASE1_FRAMES + PHASE2_FRAMES:
+    elif phase == 1:
         # PHASE 2: Transform to 3D cylinder
-        phase_progress = (frame - PHASE1_FRAMES) / PHASE2_FRAMES
-        t = ease_in_out(phase_progress)
-        
-        z_spacing = 0.1 * t
-        elev = 90 - (45 * t)
-        azim = -90 + (15 * t)
+        show_rings(n, z_spacing, alpha_phase2, 2.2)
         
-        for i in range(n):
-            theta = np.linspace(0, 2*np.pi, 200)
-            x = r[i] * np.cos(theta)
-            y = r[i] * np.sin(theta)
-            z = np.full_like(theta, i * z_spacing)
-            
-            color = pct_color(vals[i])
-            alpha = 0.75 - (i * 0.01)
-            alpha = max(alpha, 0.3)
-            lw = 2.2
-            
-            line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-            lines.append(line)
-        
-        # Fade out text
+        # Fade out the last day's text
+        main_text.set_text(f"{vals[-1]:.1f}%")
+        main_text.set_color(colors[-1])
+        date_text.set_text(labels[-1])
         main_text.set_alpha(0.8 * (1 - t))
         date_text.set_alpha(0.7 * (1 - t))
         
-    elif frame < PHASE1_FRAMES + PHASE2_FRAMES + PHASE3_FRAMES:
+    elif phase == 2:
         # PHASE 3: Rotate to side view
-        phase_progress = (frame - PHASE1_FRAMES - PHASE2_FRAMES) / PHASE3_FRAMES
-        t = ease_in_out(phase_progress)
-        
-        z_spacing = 0.1
-        elev = 45 - (45 * t)
-        azim = -75 + (75 * t)
-        
-        for i in range(n):
-            theta = np.linspace(0, 2*np.pi, 200)
-            x = r[i] * np.cos(theta)
-            y = r[i] * np.sin(theta)
-            z = np.full_like(theta, i * z_spacing)
-            
-            color = pct_color(vals[i])
-            alpha = 0.85
-            lw = 2.5
-            
-            line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-            lines.append(line)
+        show_rings(n, z_spacing, 0.85, 2.5)
         
         # Add date labels in side view
         if t > 0.4:
             label_alpha = min(1.0, (t - 0.4) / 0.3)
-            for i in range(0, n, 2):
-                txt = ax.text(1.5, 0, i * z_spacing, labels[i],
-                            color="#aaaaaa", fontsize=7, alpha=label_alpha * 0.85,
-                            ha='left')
-                date_labels_3d.append(txt)
+            for txt in date_labels_3d:
+                txt.set_alpha(label_alpha * 0.85)
+                txt.set_visible(True)
         
         main_text.set_alpha(0)
         date_text.set_alpha(0)
         
     else:
         # HOLD final view
-        z_spacing = 0.1
-        elev = 0
-        azim = 0
-        
-        for i in range(n):
-            theta = np.linspace(0, 2*np.pi, 200)
-            x = r[i] * np.cos(theta)
-            y = r[i] * np.sin(theta)
-            z = np.full_like(theta, i * z_spacing)
-            
-            color = pct_color(vals[i])
-            alpha = 0.85
-            lw = 2.5
-            
-            line = ax.plot(x, y, z, color=color, alpha=alpha, lw=lw)[0]
-            lines.append(line)
+        show_rings(n, z_spacing, 0.85, 2.5)
         
         # Show date labels
-        for i in range(0, n, 2):
-            txt = ax.text(1.5, 0, i * z_spacing, labels[i],
-                        color="#aaaaaa", fontsize=7, alpha=0.85, ha='left')
-            date_labels_3d.append(txt)
+        for txt in date_labels_3d:
+            txt.set_alpha(0.85)
+            txt.set_visible(True)
         
         main_text.set_alpha(0)
         date_text.set_alpha(0)
     
     # Update view smoothly
-    ax.view_init(elev=elev, azim=azim)
+    ax.view_init(elev=frame_elev[frame], azim=frame_azim[frame])
     
-    return lines + date_labels_3d + [title_text, subtitle_text, main_text, date_text]
+    return all_lines + date_labels_3d + [title_text, subtitle_text, main_text, date_text]
 
 # ---------- SAVE ----------
-anim = FuncAnimation(fig, update, frames=total_frames, init_func=init, interval=1000/FPS, blit=False)
-anim.save(OUT_MP4, writer=FFMpegWriter(fps=FPS, bitrate=5000))
+# PHASE 1 keeps the top-down camera fixed: render the empty scene once and
+# blit only the artists that move over it. From PHASE 2 on the camera moves
+# every frame, so those frames are full draws.
+phase1_artists = all_lines + [main_text, date_text]
+
+init()
+fig.canvas.draw()
+background = fig.canvas.copy_from_bbox(fig.bbox)
+width, height = fig.canvas.get_width_height()
+
+def render_frame(frame):
+    update(frame)
+    if frame_phase[frame] == 0:
+        # The background is the empty scene drawn before any worker forked,
+        # so it holds for every PHASE 1 frame. The projection is rebuilt
+        # from the current view rather than trusting the last full draw in
+        # this process, which may have been a later phase's camera.
+        ax.M = ax.get_proj()
+        ax.invM = np.linalg.inv(ax.M)
+        fig.canvas.restore_region(background)
+        rings.do_3d_projection()
+        for artist in phase1_artists:
+            fig.draw_artist(artist)
+    else:
+        fig.canvas.draw()
+    return bytes(fig.canvas.buffer_rgba())
+
+# Stream raw RGBA frames straight into an ffmpeg pipe
+proc = subprocess.Popen([
+    "ffmpeg", "-y", "-loglevel", "error",
+    "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(FPS),
+    "-i", "-",
+    "-c:v", "libx264", "-preset", "veryfast", "-tune", "animation", "-threads", "0",
+    "-b:v", "5000k", "-pix_fmt", "yuv420p",
+    OUT_MP4,
+], stdin=subprocess.PIPE)
+
+# HOLD is a still image: only its first frame is rendered (if there is a
+# HOLD at all)
+hold_start = PHASE_BOUNDS[3]
+frames = range(min(hold_start + 1, total_frames))
+
+# Every frame depends only on its index (render_frame rebuilds what a
+# blitted frame needs), so forked workers, each with its own copy of the
+# figure, can render chunks in any order while imap writes the frames back
+# in order. Without fork (Windows) render in this process.
+if WORKERS > 1 and "fork" in multiprocessing.get_all_start_methods():
+    with multiprocessing.get_context("fork").Pool(WORKERS) as pool:
+        for buf in pool.imap(render_frame, frames, chunksize=FRAME_CHUNK):
+            proc.stdin.write(buf)
+else:
+    for frame in frames:
+        buf = render_frame(frame)
+        proc.stdin.write(buf)
+
+# ...and resent for the rest of the hold
+for _ in range(max(HOLD_FRAMES - 1, 0)):
+    proc.stdin.write(buf)
+proc.stdin.close()
+proc.wait()
 print(f"✓ Premium 3D transformation animation saved: {OUT_MP4}")
 plt.close()
\ No newline at end of file